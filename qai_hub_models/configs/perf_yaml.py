@@ -6,17 +6,21 @@
 from __future__ import annotations
 
 import os
+from collections.abc import Iterator
+from functools import cache
 from pathlib import Path
-from typing import Callable, Optional, cast
+from typing import Any, Callable, Optional, cast
 
 import qai_hub as hub
-from pydantic import Field
+from pydantic import ConfigDict, Field, model_validator, with_config
 from qai_hub.client import JobType
+from typing_extensions import NotRequired, TypedDict
 
 from qai_hub_models.configs.tool_versions import ToolVersions
-from qai_hub_models.models.common import Precision
+from qai_hub_models.models.common import Precision, QAIRTVersion
 from qai_hub_models.scorecard import ScorecardDevice, ScorecardProfilePath
-from qai_hub_models.utils.base_config import BaseQAIHMConfig
+from qai_hub_models.utils.base_config import BaseQAIHMConfig, load_yaml
+from qai_hub_models.utils.envvars import TrustPerfYamlEnvvar
 from qai_hub_models.utils.path_helpers import QAIHM_MODELS_ROOT
 
 
@@ -24,48 +28,50 @@ class QAIHMModelPerf(BaseQAIHMConfig):
     """Schema for perf.yaml files."""
 
     class PerformanceDetails(BaseQAIHMConfig):
-        class TimeToFirstTokenRangeMillieconds(BaseQAIHMConfig):
+        # Leaf records are TypedDicts rather than models. They are created many
+        # thousands of times when loading perf.yaml files, and a TypedDict is
+        # validated in place without constructing a model instance per entry.
+        @with_config(ConfigDict(extra="forbid"))
+        class TimeToFirstTokenRangeMillieconds(TypedDict):
             min: float
             max: float
 
-        class PeakMemoryRangeMB(BaseQAIHMConfig):
+        @with_config(ConfigDict(extra="forbid"))
+        class PeakMemoryRangeMB(TypedDict):
             min: int
             max: int
 
-            @staticmethod
-            def from_bytes(
-                mmin: int, mmax: int
-            ) -> QAIHMModelPerf.PerformanceDetails.PeakMemoryRangeMB:
-                return QAIHMModelPerf.PerformanceDetails.PeakMemoryRangeMB(
-                    min=round(mmin / (1 << 20)),
-                    max=round(mmax / (1 << 20)),
-                )
-
-        class LayerCounts(BaseQAIHMConfig):
+        @with_config(ConfigDict(extra="forbid"))
+        class LayerCounts(TypedDict):
             total: int
-            npu: int = 0
-            gpu: int = 0
-            cpu: int = 0
-
-            @staticmethod
-            def from_layers(npu: int = 0, gpu: int = 0, cpu: int = 0):
-                return QAIHMModelPerf.PerformanceDetails.LayerCounts(
-                    total=npu + gpu + cpu,
-                    npu=npu,
-                    gpu=gpu,
-                    cpu=cpu,
-                )
+            # Compute units with 0 layers are omitted.
+            npu: NotRequired[int]
+            gpu: NotRequired[int]
+            cpu: NotRequired[int]
+
+        @staticmethod
+        def peak_memory_range_from_bytes(
+            mmin: int, mmax: int
+        ) -> QAIHMModelPerf.PerformanceDetails.PeakMemoryRangeMB:
+            return QAIHMModelPerf.PerformanceDetails.PeakMemoryRangeMB(
+                min=round(mmin / (1 << 20)),
+                max=round(mmax / (1 << 20)),
+            )
 
-            @property
-            def primary_compute_unit(self):
-                if self.npu == 0 and self.gpu == 0 and self.cpu == 0:
-                    return "null"
-                compute_unit_for_most_layers = max(self.cpu, self.gpu, self.npu)
-                if compute_unit_for_most_layers == self.npu:
-                    return "NPU"
-                if compute_unit_for_most_layers == self.gpu:
-                    return "GPU"
-                return "CPU"
+        @staticmethod
+        def layer_counts_from_layers(
+            npu: int = 0, gpu: int = 0, cpu: int = 0
+        ) -> QAIHMModelPerf.PerformanceDetails.LayerCounts:
+            counts = QAIHMModelPerf.PerformanceDetails.LayerCounts(
+                total=npu + gpu + cpu
+            )
+            if npu:
+                counts["npu"] = npu
+            if gpu:
+                counts["gpu"] = gpu
+            if cpu:
+                counts["cpu"] = cpu
+            return counts
 
         # Only set for LLMs.
         time_to_first_token_range_milliseconds: Optional[
@@ -91,6 +97,29 @@ class QAIHMModelPerf(BaseQAIHMConfig):
         # All jobs will include QAIRT version, + the inference engine version used (tflite, onnx ,etc.)
         tool_versions: ToolVersions = Field(default_factory=ToolVersions)
 
+        @model_validator(mode="after")
+        def fill_primary_compute_unit(self) -> QAIHMModelPerf.PerformanceDetails:
+            # Store the primary compute unit alongside the layer counts,
+            # so readers never need to recompute it from the counts.
+            if self.primary_compute_unit is None and self.layer_counts is not None:
+                self.primary_compute_unit = layer_primary_compute_unit(
+                    self.layer_counts
+                )
+            return self
+
+        @classmethod
+        def _from_trusted_dict(
+            cls, raw: dict[str, Any]
+        ) -> QAIHMModelPerf.PerformanceDetails:
+            if "tool_versions" in raw:
+                raw = {
+                    **raw,
+                    "tool_versions": _tool_versions_from_trusted_dict(
+                        raw["tool_versions"]
+                    ),
+                }
+            return cls.model_construct(**raw)
+
     class AssetDetails(BaseQAIHMConfig):
         model_id: str
         tool_versions: ToolVersions = Field(default_factory=ToolVersions)
@@ -113,6 +142,17 @@ class QAIHMModelPerf(BaseQAIHMConfig):
                 model_id=model_id, tool_versions=ToolVersions.from_job(job)
             )
 
+        @classmethod
+        def _from_trusted_dict(cls, raw: dict[str, Any]) -> QAIHMModelPerf.AssetDetails:
+            if "tool_versions" in raw:
+                raw = {
+                    **raw,
+                    "tool_versions": _tool_versions_from_trusted_dict(
+                        raw["tool_versions"]
+                    ),
+                }
+            return cls.model_construct(**raw)
+
     class ComponentDetails(BaseQAIHMConfig):
         universal_assets: dict[ScorecardProfilePath, QAIHMModelPerf.AssetDetails] = (
             Field(default_factory=dict)
@@ -125,11 +165,57 @@ class QAIHMModelPerf(BaseQAIHMConfig):
             dict[ScorecardProfilePath, QAIHMModelPerf.PerformanceDetails],
         ] = Field(default_factory=dict)
 
+        @classmethod
+        def _from_trusted_dict(
+            cls, raw: dict[str, Any]
+        ) -> QAIHMModelPerf.ComponentDetails:
+            out = cls.model_construct(**raw)
+            if "universal_assets" in raw:
+                out.universal_assets = {
+                    ScorecardProfilePath(
+                        path
+                    ): QAIHMModelPerf.AssetDetails._from_trusted_dict(asset)
+                    for path, asset in raw["universal_assets"].items()
+                }
+            if "device_assets" in raw:
+                out.device_assets = {
+                    ScorecardDevice.parse(device): {
+                        ScorecardProfilePath(
+                            path
+                        ): QAIHMModelPerf.AssetDetails._from_trusted_dict(asset)
+                        for path, asset in device_assets.items()
+                    }
+                    for device, device_assets in raw["device_assets"].items()
+                }
+            if "performance_metrics" in raw:
+                out.performance_metrics = {
+                    ScorecardDevice.parse(device): {
+                        ScorecardProfilePath(
+                            path
+                        ): QAIHMModelPerf.PerformanceDetails._from_trusted_dict(details)
+                        for path, details in device_metrics.items()
+                    }
+                    for device, device_metrics in raw["performance_metrics"].items()
+                }
+            return out
+
     class PrecisionDetails(BaseQAIHMConfig):
         components: dict[str, QAIHMModelPerf.ComponentDetails] = Field(
             default_factory=dict
         )
 
+        @classmethod
+        def _from_trusted_dict(
+            cls, raw: dict[str, Any]
+        ) -> QAIHMModelPerf.PrecisionDetails:
+            out = cls.model_construct(**raw)
+            if "components" in raw:
+                out.components = {
+                    name: QAIHMModelPerf.ComponentDetails._from_trusted_dict(component)
+                    for name, component in raw["components"].items()
+                }
+            return out
+
     supported_devices: list[ScorecardDevice] = Field(default_factory=list)
     supported_chipsets: list[str] = Field(default_factory=list)
     precisions: dict[Precision, QAIHMModelPerf.PrecisionDetails] = Field(
@@ -185,26 +271,52 @@ class QAIHMModelPerf(BaseQAIHMConfig):
         include_paths
             Scorecard Profile Paths to loop over. If None, uses all enabled paths.
         """
-        for precision, precision_perf in self.precisions.items():
-            for component_name, component_detail in precision_perf.components.items():
-                for (
-                    device,
-                    device_detail,
-                ) in component_detail.performance_metrics.items():
-                    for path, profile_perf_details in device_detail.items():
-                        if include_paths and path not in include_paths:
-                            continue
-                        res = callback(
-                            precision,
-                            component_name,
-                            device,
-                            path,
-                            profile_perf_details,
-                        )
-                        # Note that res may be None. We ignore the return value in that case.
-                        if res is False:
-                            # If res is explicitly false, stop and return
-                            return
+        include_path_set = frozenset(include_paths) if include_paths else None
+        for (
+            precision,
+            component_name,
+            device,
+            path,
+            profile_perf_details,
+        ) in self.entries():
+            if include_path_set is not None and path not in include_path_set:
+                continue
+            res = callback(
+                precision,
+                component_name,
+                device,
+                path,
+                profile_perf_details,
+            )
+            # Note that res may be None. We ignore the return value in that case.
+            if res is False:
+                # If res is explicitly false, stop and return
+                return
+
+    def entries(
+        self,
+    ) -> Iterator[
+        tuple[
+            Precision,
+            str,
+            ScorecardDevice,
+            ScorecardProfilePath,
+            QAIHMModelPerf.PerformanceDetails,
+        ]
+    ]:
+        """
+        Flat iterator over every perf.yaml job entry.
+
+        Yields tuples of (precision, component name, device, path, perf details).
+        See for_each_entry for details on each tuple element.
+        """
+        return (
+            (precision, component_name, device, path, profile_perf_details)
+            for precision, precision_perf in self.precisions.items()
+            for component_name, component_detail in precision_perf.components.items()
+            for device, device_detail in component_detail.performance_metrics.items()
+            for path, profile_perf_details in device_detail.items()
+        )
 
     @classmethod
     def from_model(
@@ -213,9 +325,100 @@ class QAIHMModelPerf(BaseQAIHMConfig):
         perf_path = QAIHM_MODELS_ROOT / model_id / "perf.yaml"
         if not_exists_ok and not os.path.exists(perf_path):
             return QAIHMModelPerf()
-        return cls.from_yaml(perf_path)
+        # Parsing + validating perf.yaml is expensive, and scorecard / readme tooling
+        # loads the same files many times per run. Parse each (file, mtime) once and
+        # hand out deep copies so callers are free to mutate the result.
+        stat = os.stat(perf_path)
+        return _load_perf_yaml_cached(
+            cls, perf_path, stat.st_mtime_ns, stat.st_size, TrustPerfYamlEnvvar.get()
+        ).model_copy(deep=True)
+
+    @classmethod
+    def from_model_unvalidated(
+        cls: type[QAIHMModelPerf], model_id: str, not_exists_ok: bool = False
+    ) -> QAIHMModelPerf:
+        """
+        Load the perf.yaml for the given model without validating it.
+
+        Only use this for perf.yaml files written by to_model_yaml (which are
+        validated when they are written). Keys are still converted to the
+        appropriate types (Precision, ScorecardDevice, ...), but the schema is
+        not checked.
+        """
+        perf_path = QAIHM_MODELS_ROOT / model_id / "perf.yaml"
+        if not_exists_ok and not os.path.exists(perf_path):
+            return QAIHMModelPerf()
+        return cls._from_trusted_yaml(perf_path)
+
+    @classmethod
+    def _from_trusted_yaml(cls: type[QAIHMModelPerf], path: Path) -> QAIHMModelPerf:
+        raw = load_yaml(path) or {}
+        out = cls.model_construct(**raw)
+        if "supported_devices" in raw:
+            out.supported_devices = [
+                ScorecardDevice.parse(device) for device in raw["supported_devices"]
+            ]
+        if "precisions" in raw:
+            out.precisions = {
+                Precision.parse(
+                    precision
+                ): QAIHMModelPerf.PrecisionDetails._from_trusted_dict(details)
+                for precision, details in raw["precisions"].items()
+            }
+        return out
 
     def to_model_yaml(self, model_id: str) -> Path:
         out = QAIHM_MODELS_ROOT / model_id / "perf.yaml"
         self.to_yaml(out)
         return out
+
+
+def layer_primary_compute_unit(
+    layer_counts: QAIHMModelPerf.PerformanceDetails.LayerCounts,
+) -> str:
+    """Get the compute unit that runs the most layers, or "null" if there are no layers."""
+    npu = layer_counts.get("npu", 0)
+    gpu = layer_counts.get("gpu", 0)
+    cpu = layer_counts.get("cpu", 0)
+    if npu == 0 and gpu == 0 and cpu == 0:
+        return "null"
+    compute_unit_for_most_layers = max(cpu, gpu, npu)
+    if compute_unit_for_most_layers == npu:
+        return "NPU"
+    if compute_unit_for_most_layers == gpu:
+        return "GPU"
+    return "CPU"
+
+
+@cache
+def _parse_trusted_qairt_version(version: str) -> QAIRTVersion:
+    """
+    Parse a QAIRT version string from a trusted perf.yaml.
+
+    A perf.yaml repeats the same few QAIRT versions for every asset and profile entry,
+    so each distinct string is parsed once. The returned instance is shared; do not modify it.
+    """
+    return QAIRTVersion(version, validate_exists_on_ai_hub=False)
+
+
+def _tool_versions_from_trusted_dict(raw: dict[str, Any]) -> ToolVersions:
+    if "qairt" in raw:
+        raw = {**raw, "qairt": _parse_trusted_qairt_version(raw["qairt"])}
+    return ToolVersions.model_construct(**raw)
+
+
+@cache
+def _load_perf_yaml_cached(
+    cls: type[QAIHMModelPerf], path: Path, mtime_ns: int, size: int, trusted: bool
+) -> QAIHMModelPerf:
+    """
+    Load the perf.yaml at the given path.
+
+    mtime_ns and size are part of the cache key so that files re-written during
+    the lifetime of this process are re-parsed.
+
+    If trusted is set, the file is loaded without validation.
+    """
+    if trusted:
+        return cls._from_trusted_yaml(path)
+    return cls.from_yaml(path)
@@ -7,11 +7,12 @@ from __future__ import annotations
 
 import math
 import os
-from glob import glob
+from pathlib import Path
 
+import cv2
 import numpy as np
 from numpy.typing import NDArray
-from PIL import Image, ImageDraw
+from torch.utils.data import get_worker_info
 
 from qai_hub_models.datasets.common import (
     BaseDataset,
@@ -21,13 +22,35 @@ from qai_hub_models.datasets.common import (
 )
 from qai_hub_models.models._shared.repaint.utils import preprocess_inputs
 from qai_hub_models.utils.asset_loaders import ASSET_CONFIG, extract_zip_file
-from qai_hub_models.utils.image_processing import app_to_net_image_inputs
 
 CELEBAHQ_VERSION = 1
 CELEBAHQ_DATASET_ID = "celebahq"
 IMAGES_DIR_NAME = "celeba_hq"
 
 
+def _list_images(directory: Path) -> list[str]:
+    """
+    Get the paths of all images in the given directory.
+    Sorted .jpg files are listed first, followed by sorted .png files.
+
+    The directory is listed with a single scandir pass,
+    rather than a separate glob (directory walk) per extension.
+    """
+    if not directory.exists():
+        return []
+    jpgs: list[str] = []
+    pngs: list[str] = []
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            if entry.name.startswith("."):
+                continue
+            if entry.name.endswith(".jpg"):
+                jpgs.append(entry.path)
+            elif entry.name.endswith(".png"):
+                pngs.append(entry.path)
+    return sorted(jpgs) + sorted(pngs)
+
+
 class CelebAHQDataset(BaseDataset):
     def __init__(
         self,
@@ -48,18 +71,46 @@ class CelebAHQDataset(BaseDataset):
         self.mask_dir = self.data_path / "mask"
         self.random_seed = random_seed
         BaseDataset.__init__(self, self.data_path, split)
-        self.random_gen = np.random.default_rng(self.random_seed)
+        self._random_gen: np.random.Generator | None = None
+        self._random_gen_pid: int | None = None
         self.input_height = input_height
         self.input_width = input_width
         self.mask_type = mask_type
 
+    @property
+    def random_gen(self) -> np.random.Generator:
+        """
+        Random generator used to create masks.
+
+        The generator is created once per process. DataLoader workers are forked with a
+        copy of the parent's generator, which would make every worker produce identical
+        masks. Instead, each worker derives its own deterministic stream from the seed
+        and its worker ID. The main process uses the seed directly.
+        """
+        pid = os.getpid()
+        if self._random_gen is None or self._random_gen_pid != pid:
+            worker_info = get_worker_info()
+            seed_seq = np.random.SeedSequence(
+                self.random_seed,
+                spawn_key=() if worker_info is None else (worker_info.id,),
+            )
+            self._random_gen = np.random.default_rng(seed_seq)
+            self._random_gen_pid = pid
+        return self._random_gen
+
     def __len__(self):
         return len(self.image_paths)
 
     def __getitem__(self, index):
-        # Load image
-        image = Image.open(self.image_paths[index]).convert("RGB")
-        image = image.resize((self.input_height, self.input_width))
+        # Load image (OpenCV decodes BGR)
+        image = cv2.cvtColor(
+            cv2.imread(self.image_paths[index], cv2.IMREAD_COLOR), cv2.COLOR_BGR2RGB
+        )
+        image = cv2.resize(
+            image,
+            (self.input_width, self.input_height),
+            interpolation=cv2.INTER_LINEAR,
+        )
         if self.mask_type == "random_stroke":
             mask_array = self.random_stroke(self.input_width, self.input_height)
         else:
@@ -69,11 +120,12 @@ class CelebAHQDataset(BaseDataset):
                 self.input_height // 4 : self.input_width // 4 * 3,
                 self.input_height // 4 : self.input_width // 4 * 3,
             ] = 1
-        mask = Image.fromarray(mask_array).convert("L")
+        # Single channel HWC mask. The stroke mask may be a flipped view, so make it contiguous.
+        mask = np.ascontiguousarray(mask_array)[..., None]
 
-        gt = app_to_net_image_inputs(image)[1].squeeze(0)
         inputs = preprocess_inputs(image, mask)
         img_tensor, mask_tensor = inputs["image"].squeeze(0), inputs["mask"].squeeze(0)
+        gt = img_tensor
         return (img_tensor, mask_tensor), gt
 
     def random_stroke(self, img_width: int, img_height: int) -> NDArray:
@@ -101,71 +153,67 @@ class CelebAHQDataset(BaseDataset):
         average_radius = (
             math.sqrt(img_height * img_height + img_width * img_width) / 8
         )  # Smaller radius
-        mask = Image.new("L", (img_width, img_height), 0)
+        mask = np.zeros((img_height, img_width), dtype=np.uint8)
         steps = 10  # Fewer strokes
-        for _ in range(self.random_gen.integers(2, steps + 1)):
-            num_vertex = self.random_gen.integers(min_num_vertex, max_num_vertex)
-            angle_min = mean_angle - self.random_gen.uniform(0, angle_range)
-            angle_max = mean_angle + self.random_gen.uniform(0, angle_range)
-            angles = []
-            vertex = []
-            for i in range(num_vertex):
-                if i % 2 == 0:
-                    angles.append(
-                        2 * math.pi - self.random_gen.uniform(angle_min, angle_max)
-                    )
-                else:
-                    angles.append(self.random_gen.uniform(angle_min, angle_max))
-
-            h, w = mask.size
-            vertex.append(
-                (
-                    int(self.random_gen.integers(0, w)),
-                    int(self.random_gen.integers(0, h)),
-                )
+
+        # Draw all random values for every stroke up front, rather than one scalar at a time.
+        # Each stroke draws values for the max number of vertices; extra values are unused.
+        num_strokes = self.random_gen.integers(2, steps + 1)
+        num_vertices = self.random_gen.integers(
+            min_num_vertex, max_num_vertex, size=num_strokes
+        )
+        angle_min = mean_angle - self.random_gen.uniform(0, angle_range, num_strokes)
+        angle_max = mean_angle + self.random_gen.uniform(0, angle_range, num_strokes)
+        angles = self.random_gen.uniform(
+            angle_min[:, None], angle_max[:, None], (num_strokes, max_num_vertex)
+        )
+        angles[:, ::2] = 2 * math.pi - angles[:, ::2]
+        radii = np.clip(
+            self.random_gen.normal(
+                loc=average_radius,
+                scale=average_radius // 2,
+                size=(num_strokes, max_num_vertex),
+            ),
+            0,
+            2 * average_radius,
+        )
+        starts = self.random_gen.integers(
+            0, (img_width, img_height), size=(num_strokes, 2)
+        )
+        widths = self.random_gen.uniform(min_width, max_width, num_strokes).astype(int)
+
+        # Vertex trails for every stroke: (num_strokes, max_num_vertex + 1, 2)
+        steps_xy = np.stack([radii * np.cos(angles), radii * np.sin(angles)], axis=-1)
+        vertices = np.concatenate(
+            [starts[:, None, :], starts[:, None, :] + np.cumsum(steps_xy, axis=1)],
+            axis=1,
+        )
+        vertices = np.clip(vertices, 0, (img_width, img_height)).astype(int)
+
+        # OpenCV draws thick lines with round caps and joints,
+        # so no extra circles are needed at each vertex.
+        for stroke_vertices, num_vertex, width in zip(vertices, num_vertices, widths):
+            cv2.polylines(
+                mask,
+                [stroke_vertices[: num_vertex + 1].astype(np.int32)],
+                isClosed=False,
+                color=1,
+                thickness=int(width),
             )
-            for i in range(num_vertex):
-                r = np.clip(
-                    self.random_gen.normal(
-                        loc=average_radius, scale=average_radius // 2
-                    ),
-                    0,
-                    2 * average_radius,
-                )
-                new_x = np.clip(vertex[-1][0] + r * math.cos(angles[i]), 0, w)
-                new_y = np.clip(vertex[-1][1] + r * math.sin(angles[i]), 0, h)
-                vertex.append((int(new_x), int(new_y)))
-
-            draw = ImageDraw.Draw(mask)
-            width = int(self.random_gen.uniform(min_width, max_width))
-            draw.line(vertex, fill=1, width=width)
-            for v in vertex:
-                draw.ellipse(
-                    (
-                        v[0] - width // 2,
-                        v[1] - width // 2,
-                        v[0] + width // 2,
-                        v[1] + width // 2,
-                    ),
-                    fill=1,
-                )
 
         if self.random_gen.normal() > 0:
-            mask = mask.transpose(Image.FLIP_LEFT_RIGHT)
+            mask = mask[:, ::-1]
         if self.random_gen.normal() > 0:
-            mask = mask.transpose(Image.FLIP_TOP_BOTTOM)
+            mask = mask[::-1]
 
-        return np.asarray(mask, np.uint8)
+        return mask
 
     def _validate_data(self) -> bool:
         if not self.image_dir.exists():
             return False
-        self.image_paths = []
-        self.mask_paths = []
-        # Populate image and mask paths ()
-        for ext in ["*.jpg", "*.png"]:
-            self.image_paths.extend(sorted(glob(os.path.join(self.image_dir, ext))))
-            self.mask_paths.extend(sorted(glob(os.path.join(self.mask_dir, ext))))
+        # Populate image and mask paths
+        self.image_paths = _list_images(self.image_dir)
+        self.mask_paths = _list_images(self.mask_dir)
 
         if not self.image_paths:
             raise ValueError(f"No images found in {self.image_dir}")
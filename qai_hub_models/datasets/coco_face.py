@@ -5,16 +5,46 @@
 
 from __future__ import annotations
 
+import os
+from dataclasses import dataclass
 from pathlib import Path
 from typing import cast
 
 import cv2
+import numpy as np
 import torch
 
 from qai_hub_models.datasets.cocobody import CocoBodyDataset
 from qai_hub_models.datasets.common import DatasetSplit
 from qai_hub_models.utils.input_spec import InputSpec
 
+# Bump this if the contents of the cached face keypoint DB change.
+KPT_DB_CACHE_VERSION = 1
+KPT_DB_CACHE_FILE_NAME = "coco_face_kpt_db.npz"
+
+
+@dataclass
+class CocoFaceKptDB:
+    """
+    Face samples in the COCO dataset, stored as parallel arrays.
+    Entry i of each array describes sample i.
+    """
+
+    # Path to each image
+    img_paths: list[Path]
+
+    # Image ID of each sample. Shape (N,), int64
+    img_ids: np.ndarray
+
+    # Category ID of each sample. Shape (N,), int64
+    category_ids: np.ndarray
+
+    # Face bounding box of each sample, in pixel space xyxy format. Shape (N, 4), float32
+    bboxes: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.img_paths)
+
 
 class CocoFaceDataset(CocoBodyDataset):
     """
@@ -40,10 +70,74 @@ class CocoFaceDataset(CocoBodyDataset):
         num_samples: int = -1,
     ):
         super().__init__(split, input_spec, num_samples)
-        self.kpt_db: list[tuple[Path, int, int, torch.Tensor]]
+        self.kpt_db: CocoFaceKptDB
+
+    def _kpt_db_cache_key(self) -> np.ndarray:
+        """
+        Key that identifies the inputs used to build the face keypoint DB.
+        The cache is invalidated if the annotations file or the image directory changes.
+        """
+        annotation_stat = os.stat(self.annotation_path)
+        image_dir_stat = os.stat(self.image_dir)
+        return np.array(
+            [
+                str(KPT_DB_CACHE_VERSION),
+                str(self.split_str),
+                str(self.annotation_path.resolve()),
+                str(annotation_stat.st_mtime_ns),
+                str(annotation_stat.st_size),
+                str(self.image_dir.resolve()),
+                str(image_dir_stat.st_mtime_ns),
+            ]
+        )
+
+    def _load_kpt_db(self) -> CocoFaceKptDB:
+        """
+        Load the face keypoint DB.
+        Building the DB walks every annotation, so the result is cached on disk next to the annotations file.
+        """
+        cache_path = self.annotation_path.parent / KPT_DB_CACHE_FILE_NAME
+        cache_key = self._kpt_db_cache_key()
+        if cache_path.exists():
+            try:
+                with np.load(cache_path) as cached:
+                    if np.array_equal(cached["key"], cache_key):
+                        return CocoFaceKptDB(
+                            [self.image_dir / name for name in cached["file_names"]],
+                            cached["img_ids"],
+                            cached["category_ids"],
+                            cached["bboxes"],
+                        )
+            except (OSError, ValueError, KeyError):
+                pass  # Unreadable or outdated cache; rebuild it below.
+
+        kpt_db = self._build_kpt_db()
+        try:
+            tmp_path = cache_path.with_suffix(f".{os.getpid()}.tmp")
+            with open(tmp_path, "wb") as f:
+                np.savez(
+                    f,
+                    key=cache_key,
+                    file_names=np.array([path.name for path in kpt_db.img_paths]),
+                    img_ids=kpt_db.img_ids,
+                    category_ids=kpt_db.category_ids,
+                    bboxes=kpt_db.bboxes,
+                )
+            os.replace(tmp_path, cache_path)
+        except OSError:
+            pass  # The cache is an optimization only.
+        return kpt_db
+
+    def _build_kpt_db(self) -> CocoFaceKptDB:
+        img_paths: list[Path] = []
+        img_ids: list[int] = []
+        category_ids: list[int] = []
+        bboxes: list[tuple[float, float, float, float]] = []
+
+        # List the image directory once, rather than calling stat() on every image path.
+        with os.scandir(self.image_dir) as entries:
+            image_file_names = frozenset(entry.name for entry in entries)
 
-    def _load_kpt_db(self) -> list[tuple[Path, int, int, torch.Tensor]]:
-        kpt_db: list[tuple[Path, int, int, torch.Tensor]] = []
         for img_id in self.img_ids:
             img_info = self.cocoGt.loadImgs(img_id)[0]
             ann_ids = self.cocoGt.getAnnIds(imgIds=img_id, catIds=[1], iscrowd=False)
@@ -59,21 +153,24 @@ class CocoFaceDataset(CocoBodyDataset):
                     y2 = y1 + h
                     bbox = (x1, y1, x2, y2)
 
-                    img_path = self.image_dir / cast(str, img_info["file_name"])
+                    file_name = cast(str, img_info["file_name"])
+                    img_path = self.image_dir / file_name
 
-                    if not img_path.exists():
+                    if file_name not in image_file_names:
                         raise FileNotFoundError(f"Image file not found at {img_path}")
 
-                    kpt_db.append(
-                        (
-                            img_path,
-                            img_id,
-                            ann.get("category_id", 0),
-                            torch.tensor(bbox, dtype=torch.float32),
-                        )
-                    )
+                    img_paths.append(img_path)
+                    img_ids.append(img_id)
+                    category_ids.append(ann.get("category_id", 0))
+                    bboxes.append(bbox)
                     break
-        return kpt_db
+
+        return CocoFaceKptDB(
+            img_paths,
+            np.array(img_ids, dtype=np.int64),
+            np.array(category_ids, dtype=np.int64),
+            np.array(bboxes, dtype=np.float32).reshape(-1, 4),
+        )
 
     def __getitem__(
         self, index: int
@@ -89,7 +186,7 @@ class CocoFaceDataset(CocoBodyDataset):
         Returns
         -------
         image
-            RGB, range [0-1] network input image.
+            BGR, range [0-255] float network input image, with shape [C, H, W].
 
         ground_truth
             imageId : int
@@ -100,19 +197,37 @@ class CocoFaceDataset(CocoBodyDataset):
                 The ground truth face bounding box in xyxy format.
                 This box is in pixel space.
         """
-        file_name, image_id, category_id, bbox = self.kpt_db[index]
-        img_path = file_name
-
-        x0, y0, x1, y1 = bbox
-        image_array = cv2.imread(cast(str, img_path))
-
+        img_path = self.kpt_db.img_paths[index]
+        image_id = int(self.kpt_db.img_ids[index])
+        category_id = int(self.kpt_db.category_ids[index])
+        bbox = torch.from_numpy(self.kpt_db.bboxes[index].copy())
+
+        x0, y0, x1, y1 = self.kpt_db.bboxes[index].tolist()
+
+        # If the face crop is at least 2x the network input size, have the JPEG decoder
+        # downscale the image by 2 while decoding. This is much cheaper than a full
+        # resolution decode, and the crop is downscaled by cv2.resize regardless.
+        if x1 - x0 + 1 >= 2 * self.target_w and y1 - y0 + 1 >= 2 * self.target_h:
+            image_array = cv2.imread(cast(str, img_path), cv2.IMREAD_REDUCED_COLOR_2)
+            scale = 2
+        else:
+            image_array = cv2.imread(cast(str, img_path))
+            scale = 1
+
+        # The crop is a view with contiguous rows, which OpenCV consumes without a copy.
         image_array = cv2.resize(
-            image_array[int(y0) : int(y1 + 1), int(x0) : int(x1 + 1)],
+            image_array[
+                int(y0 / scale) : int((y1 + 1) / scale),
+                int(x0 / scale) : int((x1 + 1) / scale),
+            ],
             (self.target_h, self.target_w),
             interpolation=cv2.INTER_LINEAR,
         )
 
-        image = torch.from_numpy(image_array).float().permute(2, 0, 1)
+        # HWC -> CHW in uint8 (one contiguous copy), then a single conversion to float.
+        # This yields a contiguous CHW tensor rather than a permuted float view.
+        image = torch.from_numpy(np.ascontiguousarray(image_array.transpose(2, 0, 1)))
+        image = image.to(torch.float32)
 
         return image, (image_id, category_id, bbox)
 
@@ -44,6 +44,8 @@ class CocoSegDataset(CocoDataset):
             num_classes,
             label_types or ["segmentations"],
         )
+        # FiftyOne IDs of the samples in self.dataset, in dataset order. Loaded on first access.
+        self._sample_ids: list[str] | None = None
 
     def __getitem__(
         self, index: int
@@ -70,67 +72,93 @@ class CocoSegDataset(CocoDataset):
             bbox_count
                 number of actual boxes present
         """
-        from fiftyone.core.sample import SampleView
+        return self.__getitems__([index])[0]
 
-        sample = self.dataset[index : index + 1].first()
-        assert isinstance(sample, SampleView)
-        image = Image.open(sample.filepath).convert("RGB")
+    def __getitems__(
+        self, indices: list[int]
+    ) -> list[tuple[torch.Tensor, tuple[torch.Tensor, torch.Tensor, int]]]:
+        """
+        Get several dataset items. See __getitem__ for the format of each item.
+
+        The file paths and annotations of all requested samples are fetched from
+        FiftyOne in a single query, rather than loading each sample (and its
+        lazily loaded fields) separately. DataLoader calls this to fetch a batch.
+        """
+        if self._sample_ids is None:
+            self._sample_ids = self.dataset.values("id")
+
+        # Each sample is fetched once, even if it is requested more than once.
+        unique_indices = list(dict.fromkeys(indices))
+        view = self.dataset.select(
+            [self._sample_ids[i] for i in unique_indices], ordered=True
+        )
+        filepaths, labels, bounding_boxes, masks = view.values(
+            [
+                "filepath",
+                "ground_truth.detections.label",
+                "ground_truth.detections.bounding_box",
+                "ground_truth.detections.mask",
+            ]
+        )
+        items = {
+            index: self._load_item(
+                filepath, sample_labels or [], sample_boxes or [], sample_masks or []
+            )
+            for index, filepath, sample_labels, sample_boxes, sample_masks in zip(
+                unique_indices, filepaths, labels, bounding_boxes, masks
+            )
+        }
+        return [items[index] for index in indices]
+
+    def _load_item(
+        self,
+        filepath: str,
+        annotation_labels: list[str],
+        bounding_boxes: list[list[float]],
+        annotation_masks: list[np.ndarray],
+    ) -> tuple[torch.Tensor, tuple[torch.Tensor, torch.Tensor, int]]:
+        """Build a dataset item from an image path and its annotations."""
+        image = Image.open(filepath).convert("RGB")
         image = image.resize((self.target_w, self.target_h))
         width, height = image.size
 
-        masks_list = []
+        # Masks are written in place into a preallocated buffer.
+        # Unused (padding) entries remain zero.
+        masks = torch.zeros((self.max_boxes, height, width), dtype=torch.uint8)
+        masks_np = masks.numpy()
         labels_list = []
-        if sample.ground_truth is not None:
-            for annotation in sample.ground_truth.detections:
-                if annotation.label not in self.label_map:
-                    print(f"Warning: Invalid label {annotation.label}")
-                    continue
-                mask = annotation.mask
-                x, y, w, h = annotation.bounding_box
-
-                point_x1 = int(x * width)
-                point_x2 = point_x1 + int(w * width)
-                point_y1 = int(y * height)
-                point_y2 = point_y1 + int(h * height)
-
-                mask_resized = cv2.resize(
-                    mask.astype(np.uint8),
-                    (point_x2 - point_x1, point_y2 - point_y1),
-                    interpolation=cv2.INTER_LINEAR,
+        for label, bounding_box, mask in zip(
+            annotation_labels, bounding_boxes, annotation_masks
+        ):
+            if label not in self.label_map:
+                print(f"Warning: Invalid label {label}")
+                continue
+            if len(labels_list) == self.max_boxes:
+                raise ValueError(
+                    f"Sample has more boxes than max boxes {self.max_boxes}. "
+                    "Re-initialize the dataset with a larger value for max_boxes."
                 )
+            x, y, w, h = bounding_box
 
-                # Change mask size from bbox size to image size
-                mask_image = np.zeros((height, width))
-                mask_image[point_y1:point_y2, point_x1:point_x2] = mask_resized
-
-                masks_list.append(mask_image)
-                labels_list.append(self.label_map[annotation.label])
+            point_x1 = int(x * width)
+            point_x2 = point_x1 + int(w * width)
+            point_y1 = int(y * height)
+            point_y2 = point_y1 + int(h * height)
 
-        masks = torch.tensor(masks_list).to(torch.uint8)
-        labels = torch.tensor(labels_list).to(torch.uint8)
-
-        num_boxes = len(labels)
-        if num_boxes == 0:
-            masks = torch.zeros((self.max_boxes, self.target_h, self.target_w)).to(
-                torch.uint8
-            )
-            labels = torch.zeros(self.max_boxes).to(torch.uint8)
-        elif num_boxes > self.max_boxes:
-            raise ValueError(
-                f"Sample has more boxes than max boxes {self.max_boxes}. "
-                "Re-initialize the dataset with a larger value for max_boxes."
-            )
-        else:
-            extra_masks = torch.zeros(
-                (
-                    self.max_boxes - num_boxes,
-                    self.target_h,
-                    self.target_w,
+            # Change mask size from bbox size, and place it within the image.
+            # Nearest neighbor interpolation keeps the mask binary.
+            masks_np[len(labels_list), point_y1:point_y2, point_x1:point_x2] = (
+                cv2.resize(
+                    mask.astype(np.uint8),
+                    (point_x2 - point_x1, point_y2 - point_y1),
+                    interpolation=cv2.INTER_NEAREST,
                 )
-            ).to(torch.uint8)
-            extra_labels = torch.zeros(self.max_boxes - num_boxes).to(torch.uint8)
-            masks = torch.concat([masks, extra_masks])
-            labels = torch.concat([labels, extra_labels])
+            )
+            labels_list.append(self.label_map[label])
+
+        num_boxes = len(labels_list)
+        labels = torch.zeros(self.max_boxes, dtype=torch.uint8)
+        labels[:num_boxes] = torch.tensor(labels_list, dtype=torch.uint8)
 
         image_pt = app_to_net_image_inputs(image)[1].squeeze(0)
         return image_pt, (masks, labels, num_boxes)
@@ -12,11 +12,13 @@ from abc import ABC, abstractmethod
 from collections.abc import Sized
 from copy import copy
 from enum import Enum, unique
-from functools import cached_property
+from functools import cache, cached_property
 from pathlib import Path
 from typing import Any, NamedTuple, final
 
-from torch.utils.data import Dataset, default_collate
+import numpy as np
+import torch
+from torch.utils.data import Dataset, default_collate, get_worker_info
 
 from qai_hub_models.utils.asset_loaders import LOCAL_STORE_DEFAULT_PATH
 from qai_hub_models.utils.envvars import IsOnCIEnvvar
@@ -40,18 +42,25 @@ class AugmentedLabelDataset(Dataset):
     """
     Augment labels to a dataset (making the label a tuple, if labels are
     already present).
+
+    Items from the base dataset are shallow-copied before the label is set,
+    unless the base dataset sets `returns_fresh_dict = True` to indicate
+    that `__getitem__` builds a new dict for every call.
     """
 
     def __init__(self, base_dataset, extra_data):
         self.base_dataset = base_dataset
         self.extra_data = extra_data
         self.extra_len = len(extra_data)
+        self.copy_items = not getattr(base_dataset, "returns_fresh_dict", False)
 
     def __len__(self):
         return len(self.base_dataset)
 
     def __getitem__(self, idx):
-        item = copy(self.base_dataset[idx])
+        item = self.base_dataset[idx]
+        if self.copy_items:
+            item = item.copy() if type(item) is dict else copy(item)
         extra_item = self.extra_data[idx % self.extra_len]
         if "label" in item:
             item["label"] = (item["label"], extra_item)
@@ -75,16 +84,48 @@ def get_folder_name(dataset_name: str, input_spec: InputSpec | None = None) -> s
     """The name of the folder under which to store this dataset."""
     if input_spec is None:
         return dataset_name
-    sha256_hasher = hashlib.sha256()
-    for key in sorted(input_spec.keys()):
-        spec = input_spec[key]
 
-        # Only include the input name and shape in the hash.
-        # The model data type can change for quantized models
-        # but we still want to use the same dataset in those cases.
-        sha256_hasher.update(f"({key}, {spec[0]})".encode())
-    hex_digest = sha256_hasher.hexdigest()
-    return f"{dataset_name}_{hex_digest[:6]}"
+    # Only include the input name and shape in the hash.
+    # The model data type can change for quantized models
+    # but we still want to use the same dataset in those cases.
+    input_spec_key = tuple(
+        (key, tuple(input_spec[key][0])) for key in sorted(input_spec.keys())
+    )
+    return _get_folder_name(dataset_name, input_spec_key)
+
+
+@cache
+def _get_folder_name(
+    dataset_name: str, input_spec_key: tuple[tuple[str, tuple[int, ...]], ...]
+) -> str:
+    # Hashing the concatenated string is equivalent to feeding each part to the
+    # hasher separately, so folder names are unchanged.
+    input_spec_str = "".join(f"({key}, {shape})" for key, shape in input_spec_key)
+    return f"{dataset_name}_{hashlib.sha256(input_spec_str.encode()).hexdigest()[:6]}"
+
+
+def _stack_ndarrays(arrays: list[Any]) -> torch.Tensor | None:
+    """
+    Stack numeric numpy arrays that share a shape and dtype into one tensor.
+    This is a single copy, rather than converting and stacking arrays one at a time.
+
+    Returns None if the arrays can't be stacked this way.
+    """
+    elem = arrays[0]
+    if elem.dtype.kind not in "biufc":
+        return None
+    for array in arrays:
+        if (
+            not isinstance(array, np.ndarray)
+            or array.shape != elem.shape
+            or array.dtype != elem.dtype
+        ):
+            return None
+    return torch.from_numpy(np.stack(arrays))
+
+
+# Dataset paths that passed BaseDataset's default validation in this process.
+_validated_dataset_paths: set[str] = set()
 
 
 class BaseDataset(Dataset, Sized, ABC):
@@ -105,6 +146,24 @@ class BaseDataset(Dataset, Sized, ABC):
     @staticmethod
     def collate_fn(batch: Any) -> Any:
         """To be passed into DataLoader(..., collate_fn=...)."""
+        # In DataLoader worker processes, default_collate writes the batch directly
+        # into shared memory, which avoids a copy when sending it to the main process.
+        if get_worker_info() is None and len(batch) > 0:
+            elem = batch[0]
+            if isinstance(elem, np.ndarray):
+                if (stacked := _stack_ndarrays(batch)) is not None:
+                    return stacked
+            elif type(elem) is dict and all(
+                isinstance(v, np.ndarray) for v in elem.values()
+            ):
+                out = {}
+                for key in elem:
+                    stacked = _stack_ndarrays([sample[key] for sample in batch])
+                    if stacked is None:
+                        break
+                    out[key] = stacked
+                else:
+                    return out
         return default_collate(batch)
 
     @final
@@ -131,7 +190,16 @@ class BaseDataset(Dataset, Sized, ABC):
 
     def _validate_data(self) -> bool:
         """Validates data downloaded on disk. By default just checks that folder exists."""
-        return self.dataset_path.exists()
+        # Datasets are often constructed many times per process (eg. in sweeps and tests).
+        # Once a dataset path is known to exist, skip the stat call (which can be slow on
+        # networked filesystems) for later instances.
+        dataset_path = str(self.dataset_path)
+        if dataset_path in _validated_dataset_paths:
+            return True
+        if os.path.exists(dataset_path):
+            _validated_dataset_paths.add(dataset_path)
+            return True
+        return False
 
     @classmethod
     def dataset_name(cls) -> str:
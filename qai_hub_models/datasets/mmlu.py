@@ -5,6 +5,7 @@
 
 from __future__ import annotations
 
+import numpy as np
 import torch
 from datasets import IterableDataset, load_dataset
 from transformers import PreTrainedTokenizerBase
@@ -13,6 +14,9 @@ from qai_hub_models.datasets.common import BaseDataset, DatasetMetadata, Dataset
 
 
 class MMLU(BaseDataset):
+    # __getitem__ builds a new dict for every sample, so AugmentedLabelDataset need not copy it.
+    returns_fresh_dict = True
+
     def __init__(
         self,
         tokenizer: PreTrainedTokenizerBase,
@@ -168,7 +172,7 @@ class MMLU(BaseDataset):
 
     def __getitem__(self, idx: int):
         return {
-            key: torch.Tensor(value).to(dtype=torch.int)
+            key: torch.from_numpy(np.asarray(value, dtype=np.int32))
             for key, value in self.dataset[idx].items()
         }
 
@@ -5,6 +5,7 @@
 
 from __future__ import annotations
 
+import numpy as np
 import torch
 from datasets import IterableDataset, load_dataset
 from transformers import PreTrainedTokenizerBase
@@ -33,6 +34,9 @@ mmmlu_splits: list[str] = [
 class MMMLU(BaseDataset):
     SUBSET_NAME = "default"
 
+    # __getitem__ builds a new dict for every sample, so AugmentedLabelDataset need not copy it.
+    returns_fresh_dict = True
+
     def __init__(
         self,
         tokenizer: PreTrainedTokenizerBase,
@@ -198,7 +202,7 @@ class MMMLU(BaseDataset):
 
     def __getitem__(self, idx: int):
         return {
-            key: torch.Tensor(value).to(dtype=torch.int)
+            key: torch.from_numpy(np.asarray(value, dtype=np.int32))
             for key, value in self.dataset[idx].items()
         }
 
@@ -5,14 +5,21 @@
 
 from __future__ import annotations
 
+from typing import TYPE_CHECKING
+
+import numpy as np
 import torch
-from datasets import IterableDataset, load_dataset
-from transformers import PreTrainedTokenizerBase
 
 from qai_hub_models.datasets.common import BaseDataset, DatasetMetadata, DatasetSplit
 
+if TYPE_CHECKING:
+    from transformers import PreTrainedTokenizerBase
+
 
 class TinyMMLU(BaseDataset):
+    # __getitem__ builds a new dict for every sample, so AugmentedLabelDataset need not copy it.
+    returns_fresh_dict = True
+
     def __init__(
         self,
         tokenizer: PreTrainedTokenizerBase,
@@ -26,6 +33,9 @@ class TinyMMLU(BaseDataset):
         self.tokenizer = tokenizer
         self.num_samples = num_samples
 
+        # Imported here so that listing datasets does not import HF datasets.
+        from datasets import load_dataset
+
         if split == DatasetSplit.TEST:
             self.split_str = "test"
         else:
@@ -52,32 +62,41 @@ class TinyMMLU(BaseDataset):
         return len(self.dataset)
 
     def preprocess_dataset(self):
+        from datasets import IterableDataset
+
         # if a cache file storing the current computation from function can be identified, use it instead of recomputing.
+        # The dataset has only 100 samples, so worker processes (num_proc) would cost more than they save.
         map_kwargs = {"num_proc": None, "load_from_cache_file": True}
 
+        # The cache file is identified by a hash of `tokenize`. Only capture what it needs
+        # (rather than `self`), so that the hash is stable and the cache is reused across runs.
+        tokenizer = self.tokenizer
+        context_length = self.context_length
+
+        # There are only 4 possible answers, so tokenize each of them once.
+        # Keep only the last token of each answer.
+        answer_token_ids = tokenizer(
+            ["Answer: " + chr(ord("A") + answer) for answer in range(4)],
+            return_token_type_ids=False,
+            add_special_tokens=False,
+            return_tensors="np",
+        )["input_ids"][:, -1:]
+
         def tokenize(sample):
-            tokenized_question = self.tokenizer(
+            tokenized_question = tokenizer(
                 sample["input_formatted"],
                 return_token_type_ids=False,
                 add_special_tokens=True,
             )
 
-            tokenized_question = {
-                k: [[field[-self.context_length :]] for field in v]
+            # Questions have different lengths, so these stay (sliced) lists.
+            result = {
+                k: [[field[-context_length:]] for field in v]
                 for k, v in tokenized_question.items()
             }
 
-            tokenized_answer = self.tokenizer(
-                ["Answer: " + chr(ord("A") + answer) for answer in sample["answer"]],
-                return_token_type_ids=False,
-                add_special_tokens=False,
-                return_tensors="pt",
-            )
-
-            result = tokenized_question
-            # Grab only the last token
-            answer_token_ids = tokenized_answer["input_ids"][:, -1:]
-            result.update({"label": answer_token_ids})
+            # Look up the answer token of every sample in the batch at once.
+            result["label"] = answer_token_ids[np.asarray(sample["answer"])]
             return result
 
         self.dataset = self.dataset.map(
@@ -92,10 +111,12 @@ class TinyMMLU(BaseDataset):
             ],
             **(map_kwargs if not isinstance(self.dataset, IterableDataset) else {}),
         )
+        # Return rows as numpy arrays rather than nested Python lists.
+        self.dataset = self.dataset.with_format("numpy")
 
     def __getitem__(self, idx: int):
         return {
-            key: torch.Tensor(value).to(dtype=torch.int)
+            key: torch.from_numpy(np.asarray(value, dtype=np.int32))
             for key, value in self.dataset[idx].items()
         }
 
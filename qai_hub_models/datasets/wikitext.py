@@ -5,16 +5,27 @@
 
 from __future__ import annotations
 
-import math
+import hashlib
+import os
+from pathlib import Path
+from typing import TYPE_CHECKING
 
 import torch
-from datasets import Dataset, load_dataset
-from transformers import PreTrainedTokenizerBase
 
 from qai_hub_models.datasets.common import BaseDataset, DatasetMetadata, DatasetSplit
+from qai_hub_models.utils.asset_loaders import ASSET_CONFIG
+
+if TYPE_CHECKING:
+    from datasets import Dataset
+    from transformers import PreTrainedTokenizerBase
+
+WIKITEXT_VERSION = 1
 
 
 class WikiText(BaseDataset):
+    # __getitem__ builds a new dict for every sample, so AugmentedLabelDataset need not copy it.
+    returns_fresh_dict = True
+
     def __init__(
         self,
         tokenizer: PreTrainedTokenizerBase,
@@ -37,8 +48,6 @@ class WikiText(BaseDataset):
                 "Wikitext dataset currently only supports `test` and `train` split"
             )
 
-        raw_dataset = self.load_raw_dataset()
-
         # This is necessary because calibrating the model on data with tokens for the "\n\n" separator between texts
         # Causes a big drop in quantization accuracy
         separator = (
@@ -46,10 +55,55 @@ class WikiText(BaseDataset):
             if split == DatasetSplit.TEST
             else self.tokenizer.bos_token or self.tokenizer.eos_token
         )
-        self.tokens = self.tokenizer(
-            separator.join(raw_dataset["text"]),
-            return_tensors="pt",
-            add_special_tokens=True,
+
+        # Tokenizing the full text takes seconds, so the result is cached on disk.
+        # The cached tensors are memory mapped; __getitem__ only reads slices of them.
+        tokens_path = self._tokens_cache_path(separator)
+        if tokens_path.exists():
+            self.tokens = torch.load(tokens_path, mmap=True, weights_only=True)
+        else:
+            raw_dataset = self.load_raw_dataset()
+            self.tokens = dict(
+                self.tokenizer(
+                    separator.join(raw_dataset["text"]),
+                    return_tensors="pt",
+                    add_special_tokens=True,
+                )
+            )
+            os.makedirs(tokens_path.parent, exist_ok=True)
+            tmp_path = tokens_path.with_suffix(f".{os.getpid()}.tmp")
+            torch.save(self.tokens, tmp_path)
+            os.replace(tmp_path, tokens_path)
+
+        self.num_tokens = int(self.tokens["input_ids"].shape[-1])
+        # Number of context_length windows needed to cover every token (ceil division).
+        self.max_num_samples = -(-self.num_tokens // self.context_length)
+
+        # [num_full_windows, context_length] views over the tokens (no copy).
+        # Only the final window can be partial; it is sliced on demand in __getitem__.
+        self.num_full_windows = self.num_tokens // self.context_length
+        num_windowed_tokens = self.num_full_windows * self.context_length
+        self.windows = {
+            key: self.tokens[key][0, :num_windowed_tokens].view(
+                self.num_full_windows, self.context_length
+            )
+            for key in ("input_ids", "attention_mask")
+        }
+
+    def _tokens_cache_path(self, separator: str) -> Path:
+        """Path to the cached tokens for this dataset, split, and tokenizer."""
+        key = "|".join(
+            [
+                type(self.tokenizer).__name__,
+                str(self.tokenizer.name_or_path),
+                str(len(self.tokenizer)),
+                separator,
+                self.split_str,
+            ]
+        )
+        key_hash = hashlib.sha256(key.encode()).hexdigest()[:16]
+        return ASSET_CONFIG.get_local_store_dataset_path(
+            self.dataset_name(), WIKITEXT_VERSION, f"tokens_{key_hash}.pt"
         )
 
     @staticmethod
@@ -64,13 +118,16 @@ class WikiText(BaseDataset):
             batch[0].get("label", batch[0]["input_ids"]),
         )
 
-    def load_raw_dataset(self) -> Dataset:
+    def load_raw_dataset(self) -> Dataset | dict[str, list[str]]:
+        # Imported here so that listing datasets does not import HF datasets.
+        from datasets import load_dataset
+
         return load_dataset(
             path="wikitext", name="wikitext-2-raw-v1", split=self.split_str
         )
 
     def __len__(self) -> int:
-        max_num = math.ceil(len(self.tokens["input_ids"][0]) / self.context_length)
+        max_num = self.max_num_samples
         if self.split_str == "train":
             # 80k samples to be passed for calibration and advanced algorithms like Sequential MSE.
             num = 20 * 4096 // self.context_length
@@ -81,9 +138,13 @@ class WikiText(BaseDataset):
         return min(num, max_num)
 
     def __getitem__(self, index: int):
-        num_tokens = self.tokens["input_ids"].shape[-1]
+        if 0 <= index < self.num_full_windows:
+            return {
+                "input_ids": self.windows["input_ids"][index : index + 1],
+                "attention_mask": self.windows["attention_mask"][index : index + 1],
+            }
         start_index = index * self.context_length
-        end_index = min((index + 1) * self.context_length, num_tokens)
+        end_index = min((index + 1) * self.context_length, self.num_tokens)
         return {
             "input_ids": self.tokens["input_ids"][:, start_index:end_index],
             "attention_mask": self.tokens["attention_mask"][:, start_index:end_index],
@@ -5,18 +5,27 @@
 
 from __future__ import annotations
 
-from datasets import Dataset, load_dataset
+from itertools import islice
 
 from qai_hub_models.datasets.wikitext import WikiText
 
 
 class WikiText_Japanese(WikiText):
-    def load_raw_dataset(self) -> Dataset:
-        dataset = load_dataset("range3/wikipedia-ja-20230101")["train"]
+    def load_raw_dataset(self) -> dict[str, list[str]]:
+        from datasets import load_dataset
+
         if self.split_str == "test":
-            return dataset[20000:20080]
-        if self.split_str == "train":
-            return dataset[0:20000]
-        raise ValueError(
-            "Wikitext Japanese dataset currently only supports `test` and `train` split"
+            start, stop = 20000, 20080
+        elif self.split_str == "train":
+            start, stop = 0, 20000
+        else:
+            raise ValueError(
+                "Wikitext Japanese dataset currently only supports `test` and `train` split"
+            )
+
+        # Only the first articles of the train split are used.
+        # Stream them rather than downloading and loading the entire split.
+        dataset = load_dataset(
+            "range3/wikipedia-ja-20230101", split="train", streaming=True
         )
+        return {"text": [row["text"] for row in islice(dataset, start, stop)]}
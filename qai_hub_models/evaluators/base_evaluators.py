@@ -6,7 +6,8 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from collections.abc import Callable, Collection
+from collections.abc import Callable, Collection, Iterator
+from itertools import islice
 from typing import NamedTuple, Union
 
 import torch
@@ -170,23 +171,13 @@ def _for_each_batch(
         total=batch_size * num_samples,
         desc=f"Number of {counting_obj} completed",
     ) as pbar:
-        for sample in data:
-            if data_has_gt:
-                inputs, ground_truth, *_ = sample
-            else:
-                inputs, ground_truth = sample, None
-
+        for inputs, ground_truth in _load_batches(
+            data, num_samples, torch_device, data_has_gt
+        ):
             if len(inputs) > 0:
                 if isinstance(inputs, torch.Tensor):
-                    inputs = inputs.to(torch_device)
                     outputs = model(inputs)
                 else:
-                    inputs = [
-                        i.to(  # pyright: ignore[reportAttributeAccessIssue]
-                            torch_device
-                        )
-                        for i in inputs
-                    ]
                     outputs = model(*inputs)
 
                 if data_has_gt:
@@ -206,3 +197,35 @@ def _for_each_batch(
             pbar.update(batch_size)
             if total_samples >= num_samples:
                 break
+
+
+def _inputs_to_device(inputs: _ModelIO, torch_device: torch.device) -> _ModelIO:
+    # On CUDA, copies from pinned host memory run asynchronously. Work queued after
+    # the copy on the same stream (ie. inference) still waits for the copy to finish.
+    non_blocking = torch_device.type == "cuda"
+    if isinstance(inputs, torch.Tensor):
+        return inputs.to(torch_device, non_blocking=non_blocking)
+    return [
+        i.to(torch_device, non_blocking=non_blocking)  # pyright: ignore[reportAttributeAccessIssue]
+        for i in inputs
+    ]
+
+
+def _load_batches(
+    data: _DataLoader,
+    num_samples: int,
+    torch_device: torch.device,
+    data_has_gt: bool,
+) -> Iterator[tuple[_ModelIO, _ModelIO | None]]:
+    """
+    Yield (inputs, ground_truth) for the first num_samples batches of data.
+    Inputs are already moved to the given device.
+    """
+    for sample in islice(data, num_samples):
+        if data_has_gt:
+            inputs, ground_truth, *_ = sample
+        else:
+            inputs, ground_truth = sample, None
+        if len(inputs) > 0:
+            inputs = _inputs_to_device(inputs, torch_device)
+        yield inputs, ground_truth
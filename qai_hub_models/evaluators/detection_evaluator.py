@@ -5,6 +5,8 @@
 
 from __future__ import annotations
 
+import multiprocessing
+import os
 from collections.abc import Collection
 
 import torch
@@ -15,6 +17,25 @@ from podm.metrics import BoundingBox, MetricPerClass, get_pascal_voc_metrics
 from qai_hub_models.evaluators.base_evaluators import BaseEvaluator, MetricMetadata
 from qai_hub_models.utils.bounding_box_processing import batched_nms
 
+# mAP is computed in worker processes only if there are at least this many (class, iOU) pairs
+# and predicted boxes. Smaller evaluations finish faster than worker processes start.
+_MIN_CLASS_IOU_PAIRS_FOR_PARALLEL_MAP = 8
+_MIN_PRED_BOXES_FOR_PARALLEL_MAP = 5000
+
+# Boxes used by an mAP worker process. Set once per worker by _init_mAP_worker.
+_worker_bboxes: dict[str, list[BoundingBox]] = {}
+
+
+def _init_mAP_worker(gt_bbox: list[BoundingBox], pred_bbox: list[BoundingBox]):
+    _worker_bboxes["gt"] = gt_bbox
+    _worker_bboxes["pred"] = pred_bbox
+
+
+def _get_mAP_for_iOU_in_worker(iOU: float) -> float:
+    return MetricPerClass.mAP(
+        get_pascal_voc_metrics(_worker_bboxes["gt"], _worker_bboxes["pred"], iOU)
+    )
+
 
 class mAPEvaluator(BaseEvaluator):
     """Evaluator that calculates mAP given stored bounding boxes."""
@@ -28,6 +49,7 @@ class mAPEvaluator(BaseEvaluator):
         mAP_default_low_iOU: float | None = None,
         mAP_default_high_iOU: float | None = None,
         mAP_default_increment_iOU: float | None = None,
+        mAP_num_processes: int | None = None,
     ):
         """
         Parameters
@@ -38,7 +60,13 @@ class mAPEvaluator(BaseEvaluator):
                 The default high iOU (inclusive) of the range for which average mAP should be calculated.
             mAP_default_increment_iOU:
                 The default iOU increment for which average mAP should be calculated.
+            mAP_num_processes:
+                Number of worker processes used to compute mAP for each iOU in a range.
+                Workers are spawned (not forked) and each receives a pickled copy of the stored boxes.
+                If None, large evaluations use one process per CPU (up to the number of iOUs),
+                and smaller ones compute mAP in this process.
         """
+        self.mAP_num_processes = mAP_num_processes
         self.mAP_default_low_iOU = (
             mAP_default_low_iOU
             if mAP_default_low_iOU is not None
@@ -84,6 +112,39 @@ class mAPEvaluator(BaseEvaluator):
             get_pascal_voc_metrics(self.gt_bbox, self.pred_bbox, iOU)
         )
 
+    def _get_num_mAP_processes(self, num_iOUs: int) -> int:
+        """Get the number of processes used to compute mAP for the given number of iOUs."""
+        if self.mAP_num_processes is not None:
+            return min(num_iOUs, self.mAP_num_processes)
+        if len(self.pred_bbox) < _MIN_PRED_BOXES_FOR_PARALLEL_MAP:
+            return 1
+        num_classes = len(
+            {box.category for box in self.gt_bbox}
+            | {box.category for box in self.pred_bbox}
+        )
+        if num_classes * num_iOUs < _MIN_CLASS_IOU_PAIRS_FOR_PARALLEL_MAP:
+            return 1
+        return min(num_iOUs, os.cpu_count() or 1)
+
+    def _get_mAP_for_iOUs(self, iOUs: list[float]) -> list[float]:
+        """
+        Get mAP for each of the given iOUs.
+
+        The mAP for each iOU is independent of the others and is computed in pure python,
+        so large evaluations split the iOUs across worker processes (see mAP_num_processes).
+        """
+        num_processes = self._get_num_mAP_processes(len(iOUs))
+        if num_processes < 2 or multiprocessing.current_process().daemon:
+            return [self.get_mAP_for_iOU(iOU) for iOU in iOUs]
+
+        # Spawned workers do not inherit this process' CUDA, OpenMP or numba state, which is not fork safe.
+        with multiprocessing.get_context("spawn").Pool(
+            num_processes,
+            initializer=_init_mAP_worker,
+            initargs=(self.gt_bbox, self.pred_bbox),
+        ) as pool:
+            return pool.map(_get_mAP_for_iOU_in_worker, iOUs)
+
     def get_mAP(
         self,
         low_iOU: float | None = None,
@@ -123,12 +184,12 @@ class mAPEvaluator(BaseEvaluator):
             else self.mAP_default_increment_iOU
         )
 
-        mAP_by_iOU: list[tuple[float, float]] = []
+        iOUs: list[float] = []
         iOU = low_iOU
         while iOU <= high_iOU:
-            iOU_mAP = self.get_mAP_for_iOU(iOU)
-            mAP_by_iOU.append((iOU, iOU_mAP))
+            iOUs.append(iOU)
             iOU += increment_iOU
+        mAP_by_iOU = list(zip(iOUs, self._get_mAP_for_iOUs(iOUs)))
 
         return (
             sum(x[1] for x in mAP_by_iOU) / len(mAP_by_iOU),
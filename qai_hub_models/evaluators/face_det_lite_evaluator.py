@@ -7,13 +7,15 @@ from __future__ import annotations
 
 from collections.abc import Collection
 
+import numpy as np
 import torch
 
 # podm comes from the object-detection-metrics pip package
 from podm.metrics import BoundingBox
 
 from qai_hub_models.evaluators.detection_evaluator import mAPEvaluator
-from qai_hub_models.models.face_det_lite.utils import detect
+from qai_hub_models.evaluators.utils.bounding_box import bounding_boxes_from_arrays
+from qai_hub_models.models.face_det_lite.utils import detect_batched
 
 
 class FaceDetLiteEvaluator(mAPEvaluator):
@@ -59,89 +61,78 @@ class FaceDetLiteEvaluator(mAPEvaluator):
         hm, box, landmark = output
         image_ids, scales, paddings, all_bboxes, all_classes, all_num_boxes = gt
 
+        # Convert ground truth to Python values once per batch, rather than one element at a time.
+        all_num_boxes_list = all_num_boxes.to(torch.int64).reshape(-1).tolist()
+        scales_list = scales.reshape(-1).tolist()
+        paddings_list = paddings.tolist()
+
+        dets_per_image = detect_batched(
+            hm,
+            box,
+            landmark,
+            threshold=self.score_threshold,
+            nms_iou=self.nms_iou_threshold,
+            stride=8,
+        )
+
+        # Boxes for the whole batch are collected, then stored once.
+        batch_gt_bboxes: list[BoundingBox] = []
+        batch_pd_bboxes: list[BoundingBox] = []
         for i in range(len(image_ids)):
             image_id = image_ids[i]
-            bboxes = all_bboxes[i][: int(all_num_boxes[i].item())]
-            classes = all_classes[i][: int(all_num_boxes[i].item())]
-            if bboxes.numel() == 0:
+            num_boxes = all_num_boxes_list[i]
+            if num_boxes == 0:
                 continue
+            bboxes = all_bboxes[i, :num_boxes].numpy()
+            is_face = all_classes[i, :num_boxes].numpy() == 0
 
             # Collect GT and prediction boxes
-            gt_bb_entry = [
-                BoundingBox.of_bbox(
-                    image_id,
-                    int(classes[j]),
-                    bboxes[j][0].item(),
-                    bboxes[j][1].item(),
-                    bboxes[j][2].item(),
-                    bboxes[j][3].item(),
-                    1.0,
-                )
-                for j in range(len(bboxes))
-                if classes[j] == 0
-            ]
-
-            dets = detect(
-                hm[i].unsqueeze(0),
-                box[i].unsqueeze(0),
-                landmark[i].unsqueeze(0),
-                threshold=self.score_threshold,
-                nms_iou=self.nms_iou_threshold,
-                stride=8,
+            gt_bb_entry = bounding_boxes_from_arrays(image_id, 0, bboxes[is_face], 1.0)
+
+            dets = dets_per_image[i]
+
+            # Expand and clamp every detected box at once.
+            # Casting to int truncates toward zero, like int() on a Python float.
+            xywh = np.array([d.xywh for d in dets], dtype=np.float64).reshape(-1, 4)
+            scores = [d.score for d in dets]
+            xmin, ymin, w, h = xywh.T
+            L = xmin.astype(np.int64)
+            R = (xmin + w).astype(np.int64)
+            T = ymin.astype(np.int64)
+            B = (ymin + h).astype(np.int64)
+            W = w.astype(np.int64)
+            H = h.astype(np.int64)
+
+            L = np.maximum(L, 0)
+            T = np.maximum(T, 0)
+            R = np.minimum(R, self.image_width - 1)
+            B = np.minimum(B, self.image_height - 1)
+
+            # Enlarge bounding box to cover more face area, if it stays within the image.
+            b_Left = L - (W * 0.05).astype(np.int64)
+            b_Top = T - (H * 0.05).astype(np.int64)
+            b_Width = (W * 1.1).astype(np.int64)
+            b_Height = (H * 1.1).astype(np.int64)
+            b_Right = b_Width - 1 + b_Left
+            b_Bottom = b_Height - 1 + b_Top
+            enlarge = (
+                (b_Left >= 0)
+                & (b_Top >= 0)
+                & (b_Right < self.image_width)
+                & (b_Bottom < self.image_height)
             )
+            res = np.where(
+                enlarge[:, None],
+                np.stack([b_Left, b_Top, b_Right, b_Bottom], axis=1),
+                np.stack([L, T, R, B], axis=1),
+            )
+
+            # Map boxes back to the original image coordinates.
+            px, py = paddings_list[i]
+            pd_boxes = (res - np.array([px, py, px, py])) / scales_list[i]
+            pd_bb_entry = bounding_boxes_from_arrays(image_id, 0, pd_boxes, scores)
+
+            batch_gt_bboxes += gt_bb_entry
+            batch_pd_bboxes += pd_bb_entry
 
-            res = []
-            for n in range(0, len(dets)):
-                xmin, ymin, w, h = dets[n].xywh
-                score = dets[n].score
-
-                L = int(xmin)
-                R = int(xmin + w)
-                T = int(ymin)
-                B = int(ymin + h)
-                W = int(w)
-                H = int(h)
-
-                if L < 0 or T < 0 or self.image_width <= R or self.image_height <= B:
-                    L = max(L, 0)
-                    T = max(T, 0)
-                    if self.image_width <= R:
-                        R = self.image_width - 1
-                    if self.image_height <= B:
-                        B = self.image_height - 1
-
-                # Enlarge bounding box to cover more face area
-                b_Left = L - int(W * 0.05)
-                b_Top = T - int(H * 0.05)
-                b_Width = int(W * 1.1)
-                b_Height = int(H * 1.1)
-
-                if (
-                    b_Left >= 0
-                    and b_Top >= 0
-                    and b_Width - 1 + b_Left < self.image_width
-                    and b_Height - 1 + b_Top < self.image_height
-                ):
-                    L = b_Left
-                    T = b_Top
-                    W = b_Width
-                    H = b_Height
-                    R = W - 1 + L
-                    B = H - 1 + T
-
-                res.append([L, T, R, B, score])
-
-            pd_bb_entry = [
-                BoundingBox.of_bbox(
-                    image_id,
-                    0,
-                    (float(item[0]) - paddings[i][0].item()) / scales[i].item(),
-                    (float(item[1]) - paddings[i][1].item()) / scales[i].item(),
-                    (float(item[2]) - paddings[i][0].item()) / scales[i].item(),
-                    (float(item[3]) - paddings[i][1].item()) / scales[i].item(),
-                    item[4],
-                )
-                for item in res
-            ]
-
-            self.store_bboxes_for_eval(gt_bb_entry, pd_bb_entry)
+        self.store_bboxes_for_eval(batch_gt_bboxes, batch_pd_bboxes)
@@ -7,13 +7,15 @@ from __future__ import annotations
 
 from collections.abc import Collection
 
+import numpy as np
 import torch
 
-# podm comes from the object-detection-metrics pip package
-from podm.metrics import BoundingBox
-
 from qai_hub_models.evaluators.detection_evaluator import mAPEvaluator
-from qai_hub_models.models.foot_track_net.app import postprocess
+from qai_hub_models.evaluators.utils.bounding_box import bounding_boxes_from_arrays
+from qai_hub_models.models.foot_track_net.app import (
+    bbox_landmarks_to_array,
+    postprocess_batched,
+)
 
 
 class FootTrackNetEvaluator(mAPEvaluator):
@@ -44,60 +46,40 @@ class FootTrackNetEvaluator(mAPEvaluator):
         image_ids, _, _, all_bboxes, all_classes, all_num_boxes = gt
         output = list(output)
 
-        for i in range(len(image_ids)):
-            output_i = (
-                output[0][i : i + 1],
-                output[1][i : i + 1],
-                output[2][i : i + 1],
-                output[3][i : i + 1],
-            )
-            face_result, person_result = postprocess(
-                *output_i, self.threshhold, self.iou_thr
-            )
+        # Copy ground truth to host memory once per batch, rather than one element at a time.
+        all_num_boxes_list = all_num_boxes.to(torch.int64).reshape(-1).tolist()
+        all_bboxes_np = all_bboxes.cpu().numpy()
+        all_classes_np = all_classes.cpu().numpy().astype(np.int64)
+        # Only face (0) and person (1) ground truth boxes are evaluated. Filter the whole batch at once.
+        all_is_face_or_person = (all_classes_np == 0) | (all_classes_np == 1)
+
+        results = postprocess_batched(
+            output[0], output[1], output[2], output[3], self.threshhold, self.iou_thr
+        )
 
+        for i in range(len(image_ids)):
+            face_result, person_result = results[i]
             image_id = image_ids[i]
-            bboxes = all_bboxes[i][: int(all_num_boxes[i].item())]
-            classes = all_classes[i][: int(all_num_boxes[i].item())]
-            if bboxes.numel() == 0:
+            num_boxes = all_num_boxes_list[i]
+            bboxes = all_bboxes_np[i, :num_boxes]
+            classes = all_classes_np[i, :num_boxes]
+            if bboxes.size == 0:
                 continue
 
             # Collect GT and prediction boxes
-            gt_bb_entry = [
-                BoundingBox.of_bbox(
-                    image_id,
-                    int(classes[j]),
-                    bboxes[j][0].item(),
-                    bboxes[j][1].item(),
-                    bboxes[j][2].item(),
-                    bboxes[j][3].item(),
-                    1.0,
-                )
-                for j in range(len(bboxes))
-                if classes[j] == 0 or classes[j] == 1
-            ]
+            is_face_or_person = all_is_face_or_person[i, :num_boxes]
+            gt_bb_entry = bounding_boxes_from_arrays(
+                image_id,
+                classes[is_face_or_person],
+                bboxes[is_face_or_person],
+                1.0,
+            )
 
-            pd_bb_entry = [
-                BoundingBox.of_bbox(
-                    image_id,
-                    0,
-                    float(item.x),
-                    float(item.y),
-                    float(item.r),
-                    float(item.b),
-                    item.score,
-                )
-                for item in face_result
-            ] + [
-                BoundingBox.of_bbox(
-                    image_id,
-                    1,
-                    float(item.x),
-                    float(item.y),
-                    float(item.r),
-                    float(item.b),
-                    item.score,
+            pd_bb_entry = []
+            for category, result in ((0, face_result), (1, person_result)):
+                result_array = bbox_landmarks_to_array(result)
+                pd_bb_entry += bounding_boxes_from_arrays(
+                    image_id, category, result_array[:, :4], result_array[:, 4]
                 )
-                for item in person_result
-            ]
 
             self.store_bboxes_for_eval(gt_bb_entry, pd_bb_entry)
@@ -14,58 +14,156 @@ from qai_hub_models.evaluators.base_evaluators import BaseEvaluator, MetricMetad
 class SegmentationOutputEvaluator(BaseEvaluator):
     """Evaluator for comparing segmentation output against ground truth."""
 
-    def __init__(self, num_classes: int, resize_to_gt: bool = False):
+    def __init__(
+        self, num_classes: int, resize_to_gt: bool = False, fast_upsample: bool = False
+    ):
+        """
+        Parameters
+        ----------
+            num_classes:
+                Number of segmentation classes.
+            resize_to_gt:
+                If set, output logits are upsampled (bilinear) to the ground truth size
+                before taking the argmax over classes.
+            fast_upsample:
+                Only applies if resize_to_gt is set. Take the argmax over classes at the output
+                resolution, then upsample the labels (nearest). This avoids interpolating every
+                class channel at full resolution, but labels near class boundaries may differ
+                from bilinear upsampling, so reported metrics are approximate.
+        """
         self.num_classes = num_classes
         self.resize_to_gt = resize_to_gt
+        self.fast_upsample = fast_upsample
         self.reset()
 
     def add_batch(self, output: torch.Tensor, gt: torch.Tensor):
         # This evaluator supports only 1 output tensor at a time.
-        output = output.cpu()
+        # Counts are computed on the device the output is on,
+        # to avoid copying full resolution outputs to the host every batch.
+        gt = gt.to(output.device)
         if self.resize_to_gt:
-            output = F.interpolate(output, gt.shape[-2:], mode="bilinear")
-            if len(output.shape) == 4:
-                output = output.argmax(1)
-        assert gt.shape == output.shape
-        self.confusion_matrix += self._generate_matrix(gt, output)
+            if self.fast_upsample:
+                labels = output.argmax(1, keepdim=True).to(torch.float32)
+                output = F.interpolate(labels, gt.shape[-2:], mode="nearest")
+                output = output.squeeze(1).to(torch.int64)
+            else:
+                output = self._resize_to_gt(output, gt.shape[-2:])
+        # The pixel counting kernel indexes both images by the same flat index,
+        # so this check must also hold when asserts are disabled.
+        if gt.shape != output.shape:
+            raise ValueError(
+                f"Ground truth shape {tuple(gt.shape)} does not match output shape {tuple(output.shape)}."
+            )
+        if self._confusion_matrix_counts.device != output.device:
+            self._confusion_matrix_counts = self._confusion_matrix_counts.to(
+                output.device
+            )
+        self._update_matrix(gt, output)
+
+    @staticmethod
+    def _resize_to_gt(output: torch.Tensor, size: torch.Size) -> torch.Tensor:
+        """
+        Upsample output logits of shape [N, C, H, W] to the given size and take the argmax over classes.
+
+        Each image is upsampled separately, so only one image's upsampled logits
+        are in memory at a time, rather than the whole batch's.
+        """
+        labels = torch.empty(
+            (output.shape[0], *size), dtype=torch.int64, device=output.device
+        )
+        for i in range(output.shape[0]):
+            upsampled = F.interpolate(output[i : i + 1], size, mode="bilinear")
+            labels[i] = upsampled[0].argmax(0)
+        return labels
 
     def reset(self):
-        self.confusion_matrix = torch.zeros((self.num_classes, self.num_classes))
+        # Pixel counts for each (ground truth, prediction) class pair, flattened.
+        # Integer counts stay exact no matter how many pixels are accumulated.
+        self._confusion_matrix_counts = torch.zeros(
+            self.num_classes**2, dtype=torch.int64
+        )
+        self._matrix_sums: (
+            tuple[torch.Tensor, torch.Tensor, torch.Tensor, torch.Tensor] | None
+        ) = None
+
+    @property
+    def confusion_matrix(self) -> torch.Tensor:
+        """Confusion matrix of shape [num_classes (ground truth), num_classes (prediction)]."""
+        return self._confusion_matrix_counts.cpu().view(
+            self.num_classes, self.num_classes
+        )
+
+    def _get_matrix_sums(
+        self,
+    ) -> tuple[torch.Tensor, torch.Tensor, torch.Tensor, torch.Tensor]:
+        """
+        Get the confusion matrix diagonal, row sums (ground truth), column sums (prediction), and total.
+        These are shared by every metric, so they are computed once until the next batch is added.
+        """
+        if self._matrix_sums is None:
+            confusion_matrix = self.confusion_matrix
+            self._matrix_sums = (
+                torch.diag(confusion_matrix),
+                torch.sum(confusion_matrix, dim=1),
+                torch.sum(confusion_matrix, dim=0),
+                torch.sum(confusion_matrix),
+            )
+        return self._matrix_sums
 
     def Pixel_Accuracy(self):
-        return torch.diag(self.confusion_matrix).sum() / self.confusion_matrix.sum()
+        diag, _, _, total = self._get_matrix_sums()
+        return diag.sum() / total
 
     def Pixel_Accuracy_Class(self):
-        Acc = torch.diag(self.confusion_matrix) / self.confusion_matrix.sum(dim=1)
+        diag, gt_sums, _, _ = self._get_matrix_sums()
+        Acc = diag / gt_sums
         return torch.nanmean(Acc)
 
     def Intersection_over_Union(self):
-        return torch.diag(self.confusion_matrix) / (
-            torch.sum(self.confusion_matrix, dim=1)
-            + torch.sum(self.confusion_matrix, dim=0)
-            - torch.diag(self.confusion_matrix)
-        )
+        diag, gt_sums, pred_sums, _ = self._get_matrix_sums()
+        return diag / (gt_sums + pred_sums - diag)
 
     def Mean_Intersection_over_Union(self):
         return torch.nanmean(self.Intersection_over_Union())
 
     def Frequency_Weighted_Intersection_over_Union(self):
-        freq = torch.sum(self.confusion_matrix, dim=1) / torch.sum(
-            self.confusion_matrix
-        )
-        iu = torch.diag(self.confusion_matrix) / (
-            torch.sum(self.confusion_matrix, dim=1)
-            + torch.sum(self.confusion_matrix, dim=0)
-            - torch.diag(self.confusion_matrix)
-        )
+        _, gt_sums, _, total = self._get_matrix_sums()
+        freq = gt_sums / total
+        iu = self.Intersection_over_Union()
 
         return (freq[freq > 0] * iu[freq > 0]).sum()
 
-    def _generate_matrix(self, gt_image, pre_image):
-        mask = (gt_image >= 0) & (gt_image < self.num_classes)
-        label = self.num_classes * gt_image[mask].int() + pre_image[mask].int()
-        count = torch.bincount(label, minlength=self.num_classes**2)
-        return count.reshape(self.num_classes, self.num_classes)
+    def _update_matrix(self, gt_image, pre_image):
+        """Add the (ground truth, prediction) pixel counts of this batch to the confusion matrix."""
+        if pre_image.device.type == "cpu":
+            # A compiled single pass avoids the mask, label and index temporaries below.
+            # The kernel is compiled for integer images, and some datasets return float masks.
+            # numba is imported here, so that importing this evaluator does not load it.
+            from qai_hub_models.evaluators.utils.segmentation import count_class_pairs
+
+            counts = torch.from_numpy(
+                count_class_pairs(
+                    gt_image.to(torch.int64).contiguous().numpy().reshape(-1),
+                    pre_image.to(torch.int64).contiguous().numpy().reshape(-1),
+                    self.num_classes,
+                )
+            )
+        else:
+            mask = (
+                (gt_image >= 0)
+                & (gt_image < self.num_classes)
+                & (pre_image >= 0)
+                & (pre_image < self.num_classes)
+            )
+            # Labels of valid pixels are < num_classes**2. Do the index math in the narrowest
+            # type that can hold them, to reduce the memory traffic over every pixel.
+            label_dtype = torch.int16 if self.num_classes**2 <= 2**15 else torch.int64
+            label = (
+                self.num_classes * gt_image.to(label_dtype) + pre_image.to(label_dtype)
+            )[mask]
+            counts = torch.bincount(label, minlength=self.num_classes**2)
+        self._confusion_matrix_counts += counts
+        self._matrix_sums = None
 
     def get_accuracy_score(self) -> float:
         return self.Mean_Intersection_over_Union()
@@ -0,0 +1,56 @@
+# ---------------------------------------------------------------------
+# Copyright (c) 2025 Qualcomm Technologies, Inc. and/or its subsidiaries.
+# SPDX-License-Identifier: BSD-3-Clause
+# ---------------------------------------------------------------------
+from __future__ import annotations
+
+from collections.abc import Sequence
+from typing import Any
+
+import numpy as np
+from podm.metrics import BoundingBox
+
+
+def bounding_boxes_from_arrays(
+    image_id: Any,
+    categories: np.ndarray | Sequence[Any] | Any,
+    xyxy: np.ndarray,
+    scores: np.ndarray | Sequence[float] | float,
+) -> list[BoundingBox]:
+    """
+    Create podm bounding boxes for every box in an image at once.
+
+    Coordinates, categories and scores are converted to python lists in one call
+    per array, rather than one tensor / array element access per box.
+
+    Parameters
+    ----------
+    image_id
+        Image that every box belongs to.
+    categories
+        Category of each box, with shape [N]. A scalar (including a string) applies to every box.
+    xyxy
+        Box coordinates in xyxy format, with shape [N, 4].
+    scores
+        Score of each box, with shape [N]. A scalar applies to every box.
+
+    Returns
+    -------
+    boxes
+        One BoundingBox per row of xyxy.
+    """
+    coords = np.asarray(xyxy).reshape(-1, 4).tolist()
+    num_boxes = len(coords)
+    if isinstance(categories, np.ndarray):
+        categories = categories.tolist()
+    elif isinstance(categories, str) or not isinstance(categories, Sequence):
+        categories = [categories] * num_boxes
+    if isinstance(scores, np.ndarray):
+        scores = scores.tolist()
+    elif not isinstance(scores, Sequence):
+        scores = [scores] * num_boxes
+
+    return [
+        BoundingBox.of_bbox(image_id, category, xtl, ytl, xbr, ybr, score)
+        for (xtl, ytl, xbr, ybr), category, score in zip(coords, categories, scores)
+    ]
@@ -0,0 +1,48 @@
+# ---------------------------------------------------------------------
+# Copyright (c) 2025 Qualcomm Technologies, Inc. and/or its subsidiaries.
+# SPDX-License-Identifier: BSD-3-Clause
+# ---------------------------------------------------------------------
+from __future__ import annotations
+
+import numba
+import numpy as np
+from numba import njit, prange
+
+
+def count_class_pairs(
+    gt_image: np.ndarray, pre_image: np.ndarray, num_classes: int
+) -> np.ndarray:
+    """
+    Count the pixels of each (ground truth, prediction) class pair in one pass over the pixels.
+    Pixels with a ground truth or prediction outside [0, num_classes) are ignored.
+
+    Parameters
+    ----------
+        gt_image (np.ndarray): Flat ground truth class of each pixel.
+        pre_image (np.ndarray): Flat predicted class of each pixel.
+        num_classes (int): Number of classes.
+
+    Returns
+    -------
+        np.ndarray: Flat int64 counts of shape (num_classes**2,), indexed by num_classes * gt + pred.
+    """
+    return _count_class_pairs(gt_image, pre_image, num_classes, numba.get_num_threads())
+
+
+# The compiled kernel is cached on disk, so it is compiled once rather than once per process.
+# The thread count is an argument, since a kernel that reads it from numba cannot be cached.
+@njit(parallel=True, cache=True)
+def _count_class_pairs(
+    gt_image: np.ndarray, pre_image: np.ndarray, num_classes: int, num_chunks: int
+) -> np.ndarray:
+    num_pixels = gt_image.shape[0]
+    chunk_size = (num_pixels + num_chunks - 1) // num_chunks
+    # Each chunk counts into its own row so that parallel chunks never write to the same count.
+    chunk_counts = np.zeros((num_chunks, num_classes * num_classes), dtype=np.int64)
+    for chunk in prange(num_chunks):
+        for i in range(chunk * chunk_size, min(num_pixels, (chunk + 1) * chunk_size)):
+            gt = gt_image[i]
+            pred = pre_image[i]
+            if gt >= 0 and gt < num_classes and pred >= 0 and pred < num_classes:
+                chunk_counts[chunk, gt * num_classes + pred] += 1
+    return chunk_counts.sum(axis=0)
@@ -10,7 +10,7 @@ from collections.abc import Callable
 from typing import Any
 
 import torch
-from transformers import GenerationConfig, TextStreamer, set_seed
+from transformers import BatchEncoding, GenerationConfig, TextStreamer, set_seed
 
 from qai_hub_models.models._shared.llm.generator import LLM_Generator, LLM_Loader
 from qai_hub_models.utils.base_model import BaseModel
@@ -38,6 +38,12 @@ class IndentedTextStreamer(TextStreamer):
         if self.printed_width == 0:
             text = self.line_start + text
 
+        # Most tokens contain no newline, so none of the newline handling below applies.
+        if "\n" not in text:
+            print(text, flush=True, end="" if not stream_end else None)
+            self.printed_width += len(text)
+            return
+
         # If there are multiple newlines, make sure that the line starter is present at every new line
         # (except the last one, since that will be taken care of when we try to print the something to that new line
         # for the first time)
@@ -92,6 +98,70 @@ class ChatApp:
         self.end_tokens = end_tokens
         self.seed = seed
 
+        # Token IDs that end generation. These depend only on the tokenizer, so compute them once.
+        self.end_token_ids = []
+        for token in self.end_tokens:
+            token_ids = self.tokenizer.encode(token, add_special_tokens=False)
+            if len(token_ids) == 1:
+                token_id = token_ids[0]
+                self.end_token_ids.append(token_id)
+        self.end_token_ids.append(self.tokenizer.eos_token_id)
+
+        # Model loaders and rope embedding for the most recently used model configuration,
+        # so they are built once rather than once per prompt. Only one configuration is kept,
+        # since the loaders hold references to the (possibly very large) extra model arguments.
+        self._loader_cache: tuple[tuple, tuple[list[LLM_Loader], Any]] | None = None
+
+    def _get_models(
+        self,
+        context_length: int,
+        host_device: torch.device,
+        checkpoint: CheckpointSpec | None,
+        model_from_pretrained_extra: dict,
+    ) -> tuple[list[LLM_Loader], Any]:
+        """
+        Get the model loaders (sequence lengths 1 and 128) and the rope embedding
+        for the given configuration. These are cached on this app until a different configuration is used.
+        """
+        # Extra arguments (eg. an fp_model instance) may not be hashable, so they are keyed by identity.
+        # The cached loaders keep references to them, so their ids cannot be reused while cached.
+        key = (
+            context_length,
+            str(host_device),
+            None if checkpoint is None else str(checkpoint),
+            tuple(sorted((k, id(v)) for k, v in model_from_pretrained_extra.items())),
+        )
+        if self._loader_cache is not None and self._loader_cache[0] == key:
+            return self._loader_cache[1]
+        # Drop the previous configuration's loaders (and the objects they reference) before loading new ones.
+        self._loader_cache = None
+
+        model_params = {
+            "context_length": context_length,
+            "host_device": host_device,
+            **model_from_pretrained_extra,
+        }
+        if checkpoint is not None:
+            model_params["checkpoint"] = checkpoint
+
+        models = [
+            LLM_Loader(self.model_cls, sequence_length, model_params, host_device)
+            for sequence_length in (1, 128)
+        ]
+        if "fp_model" in model_from_pretrained_extra:
+            config = model_from_pretrained_extra["fp_model"].llm_config
+            rope_embedding = self.model_cls.EmbeddingClass(
+                max_length=context_length, config=config
+            )
+        else:
+            # LLM_Generator loads the 128 sequence length model on construction,
+            # so loading it here does not cost an extra load. The model already built
+            # the rope embedding for this context length, so share it rather than building another.
+            rope_embedding = models[-1].load().embedding
+
+        self._loader_cache = (key, (models, rope_embedding))
+        return models, rope_embedding
+
     def generate_output_prompt(
         self,
         input_prompt: str,
@@ -112,29 +182,21 @@ class ChatApp:
         input_tokens = self.tokenizer(
             input_prompt_processed,
             return_tensors="pt",
-        ).to(host_device)
-
-        model_params = {
-            "context_length": context_length,
-            "host_device": host_device,
-            **model_from_pretrained_extra,
-        }
-        checkpoint = None if checkpoint == "DEFAULT_UNQUANTIZED" else checkpoint
-        if checkpoint is not None:
-            model_params["checkpoint"] = checkpoint
-
-        models = [
-            LLM_Loader(self.model_cls, sequence_length, model_params, host_device)
-            for sequence_length in (1, 128)
-        ]
-        if "fp_model" in model_from_pretrained_extra:
-            config = model_from_pretrained_extra["fp_model"].llm_config
+        )
+        if host_device.type == "cuda":
+            # Copy from pinned memory without blocking, so the copy overlaps with getting the models below.
+            input_tokens = BatchEncoding(
+                {
+                    name: tensor.pin_memory().to(host_device, non_blocking=True)
+                    for name, tensor in input_tokens.items()
+                }
+            )
         else:
-            config = models[-1].load().llm_config
+            input_tokens = input_tokens.to(host_device)
 
-        # TODO: Use instance in model already?
-        rope_embedding = self.model_cls.EmbeddingClass(
-            max_length=context_length, config=config
+        checkpoint = None if checkpoint == "DEFAULT_UNQUANTIZED" else checkpoint
+        models, rope_embedding = self._get_models(
+            context_length, host_device, checkpoint, model_from_pretrained_extra
         )
         inferencer = LLM_Generator(
             models,
@@ -143,16 +205,9 @@ class ChatApp:
         )
 
         # can set temperature, topK, topP, etc here
-        end_token_ids = []
-        for token in self.end_tokens:
-            token_ids = self.tokenizer.encode(token, add_special_tokens=False)
-            if len(token_ids) == 1:
-                token_id = token_ids[0]
-                end_token_ids.append(token_id)
-        end_token_ids.append(self.tokenizer.eos_token_id)
         inferencer.generation_config = GenerationConfig(
             max_new_tokens=max_output_tokens,
-            eos_token_id=end_token_ids,
+            eos_token_id=list(self.end_token_ids),
             pad_token_id=self.tokenizer.pad_token_id,
             do_sample=True,
             top_k=40,
@@ -170,3 +225,8 @@ class ChatApp:
             streamer=streamer,
         )
         del inferencer
+
+        # Only one model is kept in memory at a time while generating (see LLM_Generator.select_model).
+        # Release the last one too, so that the next prompt does not start with two models loaded.
+        for model in models:
+            model.release()
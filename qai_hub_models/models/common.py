@@ -5,29 +5,77 @@
 
 from __future__ import annotations
 
+import hashlib
+import json
+import os
 import re
-from dataclasses import dataclass, field
+import time
+from dataclasses import dataclass, field, replace
 from enum import Enum, unique
-from typing import Any, Optional, Union
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Optional, Union
 
 import numpy as np
 import qai_hub as hub
-from pydantic import GetCoreSchemaHandler
-from pydantic_core import core_schema
 from qai_hub.client import QuantizeDtype
 from qai_hub.hub import _global_client
 from qai_hub.public_rest_api import get_framework_list
 from typing_extensions import assert_never
 
+from qai_hub_models.utils.envvars import CacheAIHubFrameworksEnvvar
+
+if TYPE_CHECKING:
+    # pydantic is only needed when these types are used in a pydantic model.
+    from pydantic import GetCoreSchemaHandler
+    from pydantic_core import core_schema
+
+# QAIRT version strings, eg. "2.39", "v2.39.0.250925", "2.39.0.250925-auto"
+_QAIRT_VERSION_RE = re.compile(
+    r"v?(?P<major>\d+)\.(?P<minor>\d+)(?P<patch>\.\d+)?(?P<ident>\.\d+\_?\d+)?(?P<flavor>\-.*)?"
+)
+
+# QAIRT versions fetched from AI Hub are cached on disk for this long.
+_FRAMEWORKS_DISK_CACHE_TTL_SECONDS = 60 * 60
+
+# Bump this if the format of the on-disk QAIRT version cache changes.
+_FRAMEWORKS_DISK_CACHE_VERSION = 1
+
+# Precision strings, eg. "w8a16", "a16w8", "w8a8_mixed_int16"
+# Weights and activations may be in either order; the override type follows the last "_mixed_".
+_PRECISION_RE = re.compile(
+    r"(?:(?P<w>w\d+)(?P<a>a\d+)?|(?P<a2>a\d+)(?P<w2>w\d+)?)?(?:.*_mixed_(?P<override>.*))?"
+)
+
 
 class QAIRTVersion:
     # Map of <Hub URL -> Valid AI Hub QAIRT Versions>
     _FRAMEWORKS: dict[str, list[QAIRTVersion.ParsedFramework]] = {}
     _HUB_DEFAULT_FRAMEWORK: dict[str, QAIRTVersion.ParsedFramework] = {}
+    # Map of <Hub URL -> (Valid AI Hub QAIRT Versions, Versions by tag, Versions by (major, minor))>
+    _FRAMEWORK_INDEX: dict[
+        str,
+        tuple[
+            list[QAIRTVersion.ParsedFramework],
+            dict[str, QAIRTVersion.ParsedFramework],
+            dict[tuple[int, int], list[QAIRTVersion.ParsedFramework]],
+        ],
+    ] = {}
+    # Map of <(Hub URL, version or tag, constructor flags) -> (Hub frameworks it was resolved from, shared instance)>
+    _SHARED_VERSIONS: dict[
+        tuple[str, str, bool, bool],
+        tuple[list[QAIRTVersion.ParsedFramework], QAIRTVersion],
+    ] = {}
+    # Map of <Hub URL -> (Hub frameworks, QAIRTVersion instance for each framework)>
+    _ALL_VERSIONS: dict[
+        str,
+        tuple[list[QAIRTVersion.ParsedFramework], list[QAIRTVersion]],
+    ] = {}
     HUB_FLAG = "--qairt_version"
     DEFAULT_AIHUB_TAG = "default"
     LATEST_AIHUB_TAG = "latest"
 
+    __slots__ = ("_api_url", "_str", "framework")
+
     def __init__(
         self,
         version_or_tag: str | QAIRTVersion.ParsedFramework,
@@ -65,22 +113,34 @@ class QAIRTVersion:
             else QAIRTVersion.ParsedFramework.parse_opt(version_or_tag)
         )
 
+        # AI Hub's QAIRT versions (which may need to be fetched) are only needed to validate this version.
+        # Otherwise the AI Hub URL is looked up only if this version is printed.
+        self._api_url: str | None
         (
             self._api_url,
             valid_hub_frameworks,
             default_framework,
-        ) = QAIRTVersion._load_frameworks()
+        ) = (
+            QAIRTVersion._load_frameworks()
+            if validate_exists_on_ai_hub
+            else (None, [], None)
+        )
         chosen_framework: QAIRTVersion.ParsedFramework | None = None
         if self._api_url and validate_exists_on_ai_hub:
             # Try to match the version_or_tag with a known QAIRT framework from AI Hub.
-            for hub_framework in valid_hub_frameworks:
-                if user_parsed_framework is None:
-                    if version_or_tag in hub_framework.tags:
+            frameworks_by_tag, frameworks_by_api_version = (
+                QAIRTVersion._get_framework_index(self._api_url, valid_hub_frameworks)
+            )
+            if user_parsed_framework is None:
+                if isinstance(version_or_tag, str):
+                    chosen_framework = frameworks_by_tag.get(version_or_tag)
+            else:
+                for hub_framework in frameworks_by_api_version.get(
+                    (user_parsed_framework.major, user_parsed_framework.minor), []
+                ):
+                    if hub_framework.version_eq(user_parsed_framework):
                         chosen_framework = hub_framework
                         break
-                elif hub_framework.version_eq(user_parsed_framework):
-                    chosen_framework = hub_framework
-                    break
 
             # If no AI Hub QAIRT framework matches, then use a default.
             if (
@@ -92,8 +152,9 @@ class QAIRTVersion:
 
             # Frameworks loaded from Hub never have the flavor, so add it manually here if the user provided one.
             if chosen_framework is not None and user_parsed_framework is not None:
-                chosen_framework = chosen_framework.copy()
-                chosen_framework.flavor = user_parsed_framework.flavor
+                chosen_framework = replace(
+                    chosen_framework, flavor=user_parsed_framework.flavor
+                )
         else:
             chosen_framework = user_parsed_framework or QAIRTVersion.ParsedFramework(
                 major=0,
@@ -114,6 +175,36 @@ class QAIRTVersion:
             )
 
         self.framework = chosen_framework
+        self._str: str | None = None
+
+    @staticmethod
+    def get(
+        version_or_tag: str,
+        return_default_if_does_not_exist: bool = False,
+        validate_exists_on_ai_hub: bool = True,
+    ) -> QAIRTVersion:
+        """
+        Same as QAIRTVersion(version_or_tag, ...), but returns a shared instance
+        if this was called before with the same arguments and AI Hub QAIRT versions.
+        The returned instance must not be modified.
+        """
+        api_url, valid_hub_frameworks, _ = QAIRTVersion._load_frameworks()
+        key = (
+            api_url,
+            version_or_tag,
+            return_default_if_does_not_exist,
+            validate_exists_on_ai_hub,
+        )
+        # Only reuse an instance resolved against the same list of AI Hub frameworks.
+        # The list is replaced if frameworks are reloaded (eg. AI Hub was not reachable last time).
+        cached = QAIRTVersion._SHARED_VERSIONS.get(key)
+        if cached is not None and cached[0] is valid_hub_frameworks:
+            return cached[1]
+        version = QAIRTVersion(
+            version_or_tag, return_default_if_does_not_exist, validate_exists_on_ai_hub
+        )
+        QAIRTVersion._SHARED_VERSIONS[key] = (valid_hub_frameworks, version)
+        return version
 
     @property
     def api_version(self) -> str:
@@ -169,6 +260,12 @@ class QAIRTVersion:
         if isinstance(other, str):
             if other in self.tags:
                 return True
+            # This version's own version strings parse to an equal version, so skip parsing them.
+            flavor = self.framework.flavor
+            if (flavor is None and other in (self.api_version, self.full_version)) or (
+                flavor and other == self.full_version_with_flavor
+            ):
+                return True
             other_framework = QAIRTVersion.ParsedFramework.parse_opt(other)
         if isinstance(other, QAIRTVersion):
             other_framework = other.framework
@@ -179,15 +276,19 @@ class QAIRTVersion:
         )
 
     def __str__(self):
-        return (
-            f"QAIRT v{self.api_version}"
-            + (
-                " | UNVERIFIED - NO AI HUB ACCESS"
-                if not self._api_url
-                else f" | {self.full_version_with_flavor}"
+        if self._str is None:
+            if self._api_url is None:
+                self._api_url = QAIRTVersion._load_frameworks()[0]
+            self._str = (
+                f"QAIRT v{self.api_version}"
+                + (
+                    " | UNVERIFIED - NO AI HUB ACCESS"
+                    if not self._api_url
+                    else f" | {self.full_version_with_flavor}"
+                )
+                + (f" | {', '.join(self.tags)}" if self.tags else "")
             )
-            + (f" | {', '.join(self.tags)}" if self.tags else "")
-        )
+        return self._str
 
     def __repr__(self):
         return str(self)
@@ -195,17 +296,29 @@ class QAIRTVersion:
     @staticmethod
     def default() -> QAIRTVersion:
         """Default QAIRT version on AI Hub."""
-        return QAIRTVersion(QAIRTVersion.DEFAULT_AIHUB_TAG)
+        return QAIRTVersion.get(QAIRTVersion.DEFAULT_AIHUB_TAG)
 
     @staticmethod
     def latest() -> QAIRTVersion:
         """Latest QAIRT version on AI Hub."""
-        return QAIRTVersion(QAIRTVersion.LATEST_AIHUB_TAG)
+        return QAIRTVersion.get(QAIRTVersion.LATEST_AIHUB_TAG)
 
     @staticmethod
     def all() -> list[QAIRTVersion]:
-        _, frameworks, _ = QAIRTVersion._load_frameworks()
-        return [QAIRTVersion(f) for f in frameworks]
+        """
+        All QAIRT versions available on AI Hub.
+        The returned instances are shared and must not be modified.
+        """
+        api_url, frameworks, _ = QAIRTVersion._load_frameworks()
+        cached = QAIRTVersion._ALL_VERSIONS.get(api_url)
+        if cached is None or cached[0] is not frameworks:
+            # Each framework is already in AI Hub's list, so don't look it up in that list again.
+            cached = (
+                frameworks,
+                [QAIRTVersion(f, validate_exists_on_ai_hub=False) for f in frameworks],
+            )
+            QAIRTVersion._ALL_VERSIONS[api_url] = cached
+        return list(cached[1])
 
     @staticmethod
     def _load_frameworks() -> tuple[str, list[ParsedFramework], ParsedFramework | None]:
@@ -222,10 +335,25 @@ class QAIRTVersion:
         try:
             api_url = _global_client.config.api_url
             if api_url not in QAIRTVersion._FRAMEWORKS:
+                use_disk_cache = CacheAIHubFrameworksEnvvar.get()
+                hub_frameworks = (
+                    QAIRTVersion._read_frameworks_disk_cache(api_url)
+                    if use_disk_cache
+                    else None
+                )
+                if hub_frameworks is None:
+                    hub_frameworks = [
+                        (f.full_version, list(f.api_tags))
+                        for f in get_framework_list(_global_client.config).frameworks
+                        if f.name == "QAIRT"
+                    ]
+                    if use_disk_cache:
+                        QAIRTVersion._write_frameworks_disk_cache(
+                            api_url, hub_frameworks
+                        )
                 QAIRTVersion._FRAMEWORKS[api_url] = [
-                    QAIRTVersion.ParsedFramework.parse(f.full_version, list(f.api_tags))
-                    for f in get_framework_list(_global_client.config).frameworks
-                    if f.name == "QAIRT"
+                    QAIRTVersion.ParsedFramework.parse(full_version, tags)
+                    for full_version, tags in hub_frameworks
                 ]
                 for framework in QAIRTVersion._FRAMEWORKS[api_url]:
                     if QAIRTVersion.DEFAULT_AIHUB_TAG in framework.tags:
@@ -242,11 +370,99 @@ class QAIRTVersion:
             QAIRTVersion._HUB_DEFAULT_FRAMEWORK.get(api_url),
         )
 
+    @staticmethod
+    def _frameworks_disk_cache_path(api_url: str) -> Path:
+        """Path of the on-disk cache of QAIRT versions available on the given AI Hub."""
+        from qai_hub_models.utils.asset_loaders import LOCAL_STORE_DEFAULT_PATH
+
+        url_hash = hashlib.sha256(api_url.encode()).hexdigest()[:16]
+        return Path(LOCAL_STORE_DEFAULT_PATH) / "aihub_frameworks" / f"{url_hash}.json"
+
+    @staticmethod
+    def _read_frameworks_disk_cache(api_url: str) -> list[tuple[str, list[str]]] | None:
+        """
+        Read the (full version, tags) of each QAIRT version available on the given AI Hub from the on-disk cache.
+        Returns None if the cache does not exist, is outdated, or can't be read.
+        """
+        cache_path = QAIRTVersion._frameworks_disk_cache_path(api_url)
+        try:
+            if (
+                time.time() - cache_path.stat().st_mtime
+                > _FRAMEWORKS_DISK_CACHE_TTL_SECONDS
+            ):
+                return None
+            with open(cache_path) as f:
+                cached = json.load(f)
+            if (
+                cached["version"] != _FRAMEWORKS_DISK_CACHE_VERSION
+                or cached["api_url"] != api_url
+            ):
+                return None
+            return [
+                (str(framework["full_version"]), [str(x) for x in framework["tags"]])
+                for framework in cached["frameworks"]
+            ]
+        except (OSError, ValueError, KeyError, TypeError):
+            return None  # Missing, unreadable, or outdated cache.
+
+    @staticmethod
+    def _write_frameworks_disk_cache(
+        api_url: str, frameworks: list[tuple[str, list[str]]]
+    ) -> None:
+        """Write the (full version, tags) of each QAIRT version available on the given AI Hub to the on-disk cache."""
+        cache_path = QAIRTVersion._frameworks_disk_cache_path(api_url)
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = cache_path.with_suffix(f".{os.getpid()}.tmp")
+            with open(tmp_path, "w") as f:
+                json.dump(
+                    {
+                        "version": _FRAMEWORKS_DISK_CACHE_VERSION,
+                        "api_url": api_url,
+                        "frameworks": [
+                            {"full_version": full_version, "tags": tags}
+                            for full_version, tags in frameworks
+                        ],
+                    },
+                    f,
+                )
+            os.replace(tmp_path, cache_path)
+        except OSError:
+            pass  # The cache is an optimization only.
+
+    @staticmethod
+    def _get_framework_index(
+        api_url: str, frameworks: list[ParsedFramework]
+    ) -> tuple[
+        dict[str, ParsedFramework], dict[tuple[int, int], list[ParsedFramework]]
+    ]:
+        """
+        Get the given AI Hub frameworks indexed by tag, and by (major, minor) version.
+        Each index preserves the order of the framework list, so the first match in the list wins.
+        """
+        index = QAIRTVersion._FRAMEWORK_INDEX.get(api_url)
+        if index is None or index[0] is not frameworks:
+            by_tag: dict[str, QAIRTVersion.ParsedFramework] = {}
+            by_api_version: dict[
+                tuple[int, int], list[QAIRTVersion.ParsedFramework]
+            ] = {}
+            for framework in frameworks:
+                for tag in framework.tags:
+                    by_tag.setdefault(tag, framework)
+                by_api_version.setdefault(
+                    (framework.major, framework.minor), []
+                ).append(framework)
+            index = (frameworks, by_tag, by_api_version)
+            QAIRTVersion._FRAMEWORK_INDEX[api_url] = index
+        return index[1], index[2]
+
     @classmethod
     def __get_pydantic_core_schema__(
         cls, source_type: Any, handler: GetCoreSchemaHandler
     ) -> core_schema.CoreSchema:
         """Defines the parsing & serialization when QAIRTVersion is used in BaseQAIHMConfig objects."""
+        from pydantic_core import core_schema
+
         return core_schema.with_info_after_validator_function(
             lambda obj, _: (
                 cls(obj, validate_exists_on_ai_hub=False)
@@ -267,6 +483,8 @@ class QAIRTVersion:
 
         major / minor are required for this to be meaningful in all sigurations.
         patch / ident / flavor are optional as they can be inferred from AI Hub's list of valid QAIRT versions.
+
+        Instances should not be modified after construction, since version strings are cached.
         """
 
         major: int
@@ -275,10 +493,18 @@ class QAIRTVersion:
         ident: str | None = None
         flavor: str | None = None
         tags: list[str] = field(default_factory=list)
+        _api_version: str | None = field(
+            default=None, init=False, repr=False, compare=False
+        )
+        _full_version_with_flavor: str | None = field(
+            default=None, init=False, repr=False, compare=False
+        )
 
         @property
         def api_version(self) -> str:
-            return f"{self.major}.{self.minor}"
+            if self._api_version is None:
+                self._api_version = f"{self.major}.{self.minor}"
+            return self._api_version
 
         @property
         def full_version(self) -> str:
@@ -290,7 +516,11 @@ class QAIRTVersion:
 
         @property
         def full_version_with_flavor(self) -> str:
-            return self.full_version + (f"-{self.flavor}" if self.flavor else "")
+            if self._full_version_with_flavor is None:
+                self._full_version_with_flavor = self.full_version + (
+                    f"-{self.flavor}" if self.flavor else ""
+                )
+            return self._full_version_with_flavor
 
         def version_eq(self, other) -> bool:
             """Return true if this version matches the other version."""
@@ -306,6 +536,8 @@ class QAIRTVersion:
                 and (
                     self.ident is None
                     or other.ident is None
+                    # Most compared idents are equal; only check prefixes if they differ.
+                    or self.ident == other.ident
                     or other.ident.startswith(self.ident)
                     or self.ident.startswith(other.ident)
                 )
@@ -334,10 +566,7 @@ class QAIRTVersion:
         def parse_opt(
             version: str, tags: list[str] | None = None
         ) -> QAIRTVersion.ParsedFramework | None:
-            if m := re.search(
-                r"v?(?P<major>\d+)\.(?P<minor>\d+)(?P<patch>\.\d+)?(?P<ident>\.\d+\_?\d+)?(?P<flavor>\-.*)?",
-                version,
-            ):
+            if m := _QAIRT_VERSION_RE.search(version):
                 g = m.groupdict()
                 major = int(g["major"])
                 minor = int(g["minor"])
@@ -363,13 +592,7 @@ class InferenceEngine(Enum):
 
     @property
     def full_package_name(self) -> str:
-        if self == InferenceEngine.TFLITE:
-            return "TensorFlow Lite"
-        if self == InferenceEngine.QNN:
-            return "QAIRT (Qualcomm AI Runtime)"
-        if self == InferenceEngine.ONNX:
-            return "ONNX Runtime"
-        assert_never(self)
+        return _INFERENCE_ENGINE_PACKAGE_NAMES[self]
 
     @property
     def supported_version(self) -> str | None:
@@ -388,7 +611,7 @@ class InferenceEngine(Enum):
         qairt_version = "2.37" if self == InferenceEngine.ONNX else "2.39"
 
         try:
-            return QAIRTVersion(qairt_version)
+            return QAIRTVersion.get(qairt_version)
         except ValueError as e:
             msg = e.args[0]
             if "is not supported by AI Hub" in msg:
@@ -410,6 +633,13 @@ class InferenceEngine(Enum):
             raise
 
 
+_INFERENCE_ENGINE_PACKAGE_NAMES: dict[InferenceEngine, str] = {
+    InferenceEngine.TFLITE: "TensorFlow Lite",
+    InferenceEngine.QNN: "QAIRT (Qualcomm AI Runtime)",
+    InferenceEngine.ONNX: "ONNX Runtime",
+}
+
+
 @unique
 class ConversionToolchain(Enum):
     """The toolchain used to convert this asset from the source model format."""
@@ -453,63 +683,27 @@ class TargetRuntime(Enum):
 
     @staticmethod
     def from_hub_model_type(model_type: hub.SourceModelType):
-        for rt in TargetRuntime:
-            if rt.hub_model_type == model_type:
-                return rt
-        raise ValueError(f"Unsupported Hub model type: {model_type}")
+        rt = _HUB_MODEL_TYPE_TARGET_RUNTIMES.get(model_type)
+        if rt is None:
+            raise ValueError(f"Unsupported Hub model type: {model_type}")
+        return rt
 
     @property
     def inference_engine(self) -> InferenceEngine:
-        if self == TargetRuntime.TFLITE:
-            return InferenceEngine.TFLITE
-        if (
-            self == TargetRuntime.QNN_CONTEXT_BINARY  # noqa: PLR1714 | Can't merge comparisons and use assert_never
-            or self == TargetRuntime.QNN_DLC
-            or self == TargetRuntime.GENIE
-        ):
-            return InferenceEngine.QNN
-        if (
-            self == TargetRuntime.ONNX  # noqa: PLR1714 | Can't merge comparisons and use assert_never
-            or self == TargetRuntime.PRECOMPILED_QNN_ONNX
-            or self == TargetRuntime.ONNXRUNTIME_GENAI
-        ):
-            return InferenceEngine.ONNX
-        assert_never(self)
+        return _TARGET_RUNTIME_INFERENCE_ENGINES[self]
 
     @property
     def file_extension(self) -> str:
         """The file extension (without the .) assets for this runtime use."""
-        if self == TargetRuntime.TFLITE:
-            return "tflite"
-        if self == TargetRuntime.QNN_CONTEXT_BINARY:
-            return "bin"
-        if self == TargetRuntime.QNN_DLC:
-            return "dlc"
-        if self == TargetRuntime.ONNX:
-            return "onnx.zip"
-        if self == TargetRuntime.PRECOMPILED_QNN_ONNX:
-            return "onnx.zip"
-        if self == TargetRuntime.GENIE:
-            return "genie.zip"
-        if self == TargetRuntime.ONNXRUNTIME_GENAI:
-            return "onnxruntime_genai.zip"
-
-        assert_never(self)
+        return _TARGET_RUNTIME_FILE_EXTENSIONS[self]
 
     @property
     def hub_model_type(self) -> hub.SourceModelType:
         """The associated hub SourceModelType for assets for this TargetRuntime."""
-        if self == TargetRuntime.QNN_CONTEXT_BINARY:
-            return hub.SourceModelType.QNN_CONTEXT_BINARY
-        if self == TargetRuntime.QNN_DLC:
-            return hub.SourceModelType.QNN_DLC
-        if self == TargetRuntime.PRECOMPILED_QNN_ONNX or self == TargetRuntime.ONNX:  # noqa: PLR1714 | Can't merge comparisons and use assert_never
-            return hub.SourceModelType.ONNX
-        if self == TargetRuntime.TFLITE:
-            return hub.SourceModelType.TFLITE
-        if self == TargetRuntime.GENIE or self == TargetRuntime.ONNXRUNTIME_GENAI:  # noqa: PLR1714 | Can't merge comparisons and use assert_never
+        model_type = _TARGET_RUNTIME_HUB_MODEL_TYPES[self]
+        if model_type is None:
             raise ValueError(f"No Hub model type is applicable for {self.value}")
-        assert_never(self)
+        return model_type
 
     @property
     def channel_last_native_execution(self) -> bool:
@@ -517,10 +711,7 @@ class TargetRuntime(Enum):
         If true, this runtime natively executes ops in NHWC (channel-last) format.
         If false, the runtime executes ops in NCHW (channel-first) format.
         """
-        return self.is_aot_compiled or self.inference_engine in [
-            InferenceEngine.QNN,
-            InferenceEngine.TFLITE,
-        ]
+        return self in _CHANNEL_LAST_TARGET_RUNTIMES
 
     @property
     def qairt_version_changes_compilation(self) -> bool:
@@ -534,22 +725,9 @@ class TargetRuntime(Enum):
 
         # Check quantized types
         if self == TargetRuntime.TFLITE:
-            return precision == Precision.w8a8
+            return precision in _TFLITE_QUANTIZED_PRECISIONS
         if self == TargetRuntime.ONNX:
-            return precision in [
-                Precision.w8a8,
-                Precision.w8a16,
-                # The following three are enabled tentatively
-                # (not experimentally verified)
-                Precision.w16a16,
-                Precision.w4a16,
-                Precision.w4,
-                # Mixed-precision profile
-                Precision.w8a8_mixed_int16,
-                Precision.w8a16_mixed_int16,
-                Precision.w8a8_mixed_fp16,
-                Precision.w8a16_mixed_fp16,
-            ]
+            return precision in _ONNX_QUANTIZED_PRECISIONS
         if (
             self == TargetRuntime.QNN_DLC  # noqa: PLR1714 | Can't merge comparisons and use assert_never
             or self == TargetRuntime.QNN_CONTEXT_BINARY
@@ -559,18 +737,7 @@ class TargetRuntime(Enum):
             or self == TargetRuntime.GENIE
             or self == TargetRuntime.ONNXRUNTIME_GENAI
         ):
-            return precision in [
-                Precision.w8a8,
-                Precision.w8a16,
-                Precision.w4a16,
-                Precision.w4,
-                Precision.w16a16,
-                # Mixed-precision profile
-                Precision.w8a8_mixed_int16,
-                Precision.w8a16_mixed_int16,
-                Precision.w8a8_mixed_fp16,
-                Precision.w8a16_mixed_fp16,
-            ]
+            return precision in _QAIRT_QUANTIZED_PRECISIONS
 
         assert_never(self)
 
@@ -592,7 +759,7 @@ class TargetRuntime(Enum):
         THIS MIGHT BE DIFFERENT THAN AI HUB's DEFAULT VERSION.
         """
         if self == TargetRuntime.GENIE:
-            return QAIRTVersion("2.37")
+            return QAIRTVersion.get("2.37")
         return self.inference_engine.default_qairt_version
 
     @property
@@ -601,12 +768,7 @@ class TargetRuntime(Enum):
         Returns true if this asset is fully compiled ahead of time (before running on target).
         This means the compiled asset contains a QNN context binary.
         """
-        return self in [
-            TargetRuntime.QNN_CONTEXT_BINARY,
-            TargetRuntime.PRECOMPILED_QNN_ONNX,
-            TargetRuntime.GENIE,
-            TargetRuntime.ONNXRUNTIME_GENAI,
-        ]
+        return self in _AOT_COMPILED_TARGET_RUNTIMES
 
     @property
     def is_exclusively_for_genai(self) -> bool:
@@ -614,6 +776,59 @@ class TargetRuntime(Enum):
         return self in [TargetRuntime.GENIE, TargetRuntime.ONNXRUNTIME_GENAI]
 
 
+# Per-runtime values for the TargetRuntime properties above.
+# Every TargetRuntime must have an entry in each table.
+_TARGET_RUNTIME_INFERENCE_ENGINES: dict[TargetRuntime, InferenceEngine] = {
+    TargetRuntime.TFLITE: InferenceEngine.TFLITE,
+    TargetRuntime.QNN_CONTEXT_BINARY: InferenceEngine.QNN,
+    TargetRuntime.QNN_DLC: InferenceEngine.QNN,
+    TargetRuntime.GENIE: InferenceEngine.QNN,
+    TargetRuntime.ONNX: InferenceEngine.ONNX,
+    TargetRuntime.PRECOMPILED_QNN_ONNX: InferenceEngine.ONNX,
+    TargetRuntime.ONNXRUNTIME_GENAI: InferenceEngine.ONNX,
+}
+_TARGET_RUNTIME_FILE_EXTENSIONS: dict[TargetRuntime, str] = {
+    TargetRuntime.TFLITE: "tflite",
+    TargetRuntime.QNN_CONTEXT_BINARY: "bin",
+    TargetRuntime.QNN_DLC: "dlc",
+    TargetRuntime.ONNX: "onnx.zip",
+    TargetRuntime.PRECOMPILED_QNN_ONNX: "onnx.zip",
+    TargetRuntime.GENIE: "genie.zip",
+    TargetRuntime.ONNXRUNTIME_GENAI: "onnxruntime_genai.zip",
+}
+# None if no Hub model type is applicable.
+_TARGET_RUNTIME_HUB_MODEL_TYPES: dict[TargetRuntime, hub.SourceModelType | None] = {
+    TargetRuntime.QNN_CONTEXT_BINARY: hub.SourceModelType.QNN_CONTEXT_BINARY,
+    TargetRuntime.QNN_DLC: hub.SourceModelType.QNN_DLC,
+    TargetRuntime.PRECOMPILED_QNN_ONNX: hub.SourceModelType.ONNX,
+    TargetRuntime.ONNX: hub.SourceModelType.ONNX,
+    TargetRuntime.TFLITE: hub.SourceModelType.TFLITE,
+    TargetRuntime.GENIE: None,
+    TargetRuntime.ONNXRUNTIME_GENAI: None,
+}
+_AOT_COMPILED_TARGET_RUNTIMES = frozenset(
+    {
+        TargetRuntime.QNN_CONTEXT_BINARY,
+        TargetRuntime.PRECOMPILED_QNN_ONNX,
+        TargetRuntime.GENIE,
+        TargetRuntime.ONNXRUNTIME_GENAI,
+    }
+)
+_CHANNEL_LAST_TARGET_RUNTIMES = frozenset(
+    runtime
+    for runtime in TargetRuntime
+    if runtime.is_aot_compiled
+    or runtime.inference_engine in [InferenceEngine.QNN, InferenceEngine.TFLITE]
+)
+# Hub model type -> first TargetRuntime (in definition order) that uses it.
+# Runtimes are visited in reverse, so earlier runtimes overwrite later ones.
+_HUB_MODEL_TYPE_TARGET_RUNTIMES: dict[hub.SourceModelType, TargetRuntime] = {
+    model_type: runtime
+    for runtime in reversed(TargetRuntime)
+    if (model_type := _TARGET_RUNTIME_HUB_MODEL_TYPES[runtime]) is not None
+}
+
+
 class _FloatDtype(Enum):
     """
     Temporary Enum to represent floating-point precision types not yet included in QuantizeDtype (Supported data types for quantize jobs).
@@ -645,10 +860,12 @@ class Precision:
     w8a8_mixed_fp16: Precision
     w8a16_mixed_fp16: Precision
 
-    _allowed_override_dtypes: set[Union[QuantizeDtype, _FloatDtype]] = {
-        QuantizeDtype.INT16,
-        _FloatDtype.FP16,
-    }
+    _allowed_override_dtypes: frozenset[Union[QuantizeDtype, _FloatDtype]] = frozenset(
+        {QuantizeDtype.INT16, _FloatDtype.FP16}
+    )
+
+    # Precision is not modified after construction, so its string and hash are computed once.
+    __slots__ = ("_hash", "_str", "activations_type", "override_type", "weights_type")
 
     def __init__(
         self,
@@ -672,6 +889,24 @@ class Precision:
         self.weights_type: QuantizeDtype | None = weights_type
         self.activations_type: QuantizeDtype | None = activations_type
         self.override_type: QuantizeDtype | _FloatDtype | None = override_type
+        self._str: str | None = None
+        self._hash: int | None = None
+
+    @classmethod
+    def _unchecked(
+        cls,
+        weights_type: Optional[QuantizeDtype],
+        activations_type: Optional[QuantizeDtype],
+        override_type: Optional[QuantizeDtype | _FloatDtype] = None,
+    ) -> Precision:
+        """Construct a Precision without validating it. Only for precisions known to be valid."""
+        precision = cls.__new__(cls)
+        precision.weights_type = weights_type
+        precision.activations_type = activations_type
+        precision.override_type = override_type
+        precision._str = None
+        precision._hash = None
+        return precision
 
     @staticmethod
     def parse(obj: Any) -> Precision:
@@ -680,21 +915,17 @@ class Precision:
         if not isinstance(obj, str):
             raise TypeError(f"Unknown type {obj} for parsing to Precision")
         string = obj
-        if string == "float":
-            return Precision.float
-
-        atype = None
-        wtype = None
-        otype_enum_name = None
-
-        if match := re.match(r"(.*)_mixed_(.*)", string):
-            otype_enum_name = match.group(2).upper()
-        if match := re.match(r"(w\d+)?(a\d+)?", string):
-            wtype = match.group(1)
-            atype = match.group(2)
-        if match := re.match(r"(a\d+)?(w\d+)?", string):
-            atype = atype or match.group(1)
-            wtype = wtype or match.group(2)
+        if (common := _PRECISION_INTERN.get(string)) is not None:
+            return common
+
+        # This pattern always matches (every group is optional).
+        match = _PRECISION_RE.match(string)
+        assert match is not None
+        wtype = match["w"] or match["w2"]
+        atype = match["a"] or match["a2"]
+        otype_enum_name = (
+            match["override"].upper() if match["override"] is not None else None
+        )
 
         if not atype and not wtype:
             raise ValueError(
@@ -771,6 +1002,11 @@ class Precision:
         )
 
     def __str__(self) -> str:
+        if self._str is None:
+            self._str = self._get_str()
+        return self._str
+
+    def _get_str(self) -> str:
         if self == Precision.float:
             return "float"
 
@@ -796,41 +1032,97 @@ class Precision:
         )
 
     def __hash__(self) -> int:
-        return hash(str(self))
+        if self._hash is None:
+            self._hash = hash(str(self))
+        return self._hash
 
     @classmethod
     def __get_pydantic_core_schema__(
         cls, source_type: Any, handler: GetCoreSchemaHandler
     ) -> core_schema.CoreSchema:
-        return core_schema.with_info_after_validator_function(
-            lambda obj, _: cls.parse(obj),
-            handler(Any),
-            field_name=handler.field_name,
+        from pydantic_core import core_schema
+
+        # parse accepts any input, so pydantic can call it directly.
+        # Precisions are strings in JSON, which the JSON schema describes.
+        return core_schema.no_info_plain_validator_function(
+            cls.parse,
+            json_schema_input_schema=core_schema.str_schema(),
             serialization=core_schema.plain_serializer_function_ser_schema(
                 Precision.__str__, when_used="json"
             ),
         )
 
 
-Precision.float = Precision(None, None)
-Precision.w8a8 = Precision(QuantizeDtype.INT8, QuantizeDtype.INT8)
-Precision.w8a16 = Precision(QuantizeDtype.INT8, QuantizeDtype.INT16)
-Precision.w16a16 = Precision(QuantizeDtype.INT16, QuantizeDtype.INT16)
-Precision.w4a16 = Precision(QuantizeDtype.INT4, QuantizeDtype.INT16)
-Precision.w4 = Precision(QuantizeDtype.INT4, None)
-Precision.w8a8_mixed_int16 = Precision(
+Precision.float = Precision._unchecked(None, None)
+Precision.w8a8 = Precision._unchecked(QuantizeDtype.INT8, QuantizeDtype.INT8)
+Precision.w8a16 = Precision._unchecked(QuantizeDtype.INT8, QuantizeDtype.INT16)
+Precision.w16a16 = Precision._unchecked(QuantizeDtype.INT16, QuantizeDtype.INT16)
+Precision.w4a16 = Precision._unchecked(QuantizeDtype.INT4, QuantizeDtype.INT16)
+Precision.w4 = Precision._unchecked(QuantizeDtype.INT4, None)
+Precision.w8a8_mixed_int16 = Precision._unchecked(
     QuantizeDtype.INT8, QuantizeDtype.INT8, QuantizeDtype.INT16
 )
-Precision.w8a16_mixed_int16 = Precision(
+Precision.w8a16_mixed_int16 = Precision._unchecked(
     QuantizeDtype.INT8, QuantizeDtype.INT16, QuantizeDtype.INT16
 )
-Precision.w8a8_mixed_fp16 = Precision(
+Precision.w8a8_mixed_fp16 = Precision._unchecked(
     QuantizeDtype.INT8, QuantizeDtype.INT8, _FloatDtype.FP16
 )
-Precision.w8a16_mixed_fp16 = Precision(
+Precision.w8a16_mixed_fp16 = Precision._unchecked(
     QuantizeDtype.INT8, QuantizeDtype.INT16, _FloatDtype.FP16
 )
 
+# Quantized precisions supported by each runtime (see TargetRuntime.supports_precision).
+_TFLITE_QUANTIZED_PRECISIONS = frozenset({Precision.w8a8})
+_ONNX_QUANTIZED_PRECISIONS = frozenset(
+    {
+        Precision.w8a8,
+        Precision.w8a16,
+        # The following three are enabled tentatively
+        # (not experimentally verified)
+        Precision.w16a16,
+        Precision.w4a16,
+        Precision.w4,
+        # Mixed-precision profile
+        Precision.w8a8_mixed_int16,
+        Precision.w8a16_mixed_int16,
+        Precision.w8a8_mixed_fp16,
+        Precision.w8a16_mixed_fp16,
+    }
+)
+_QAIRT_QUANTIZED_PRECISIONS = frozenset(
+    {
+        Precision.w8a8,
+        Precision.w8a16,
+        Precision.w4a16,
+        Precision.w4,
+        Precision.w16a16,
+        # Mixed-precision profile
+        Precision.w8a8_mixed_int16,
+        Precision.w8a16_mixed_int16,
+        Precision.w8a8_mixed_fp16,
+        Precision.w8a16_mixed_fp16,
+    }
+)
+
+# Common precision strings, mapped to the shared instances above.
+# Parsing one of these returns the shared instance rather than building a new one.
+_PRECISION_INTERN: dict[str, Precision] = {
+    str(precision): precision
+    for precision in (
+        Precision.float,
+        Precision.w8a8,
+        Precision.w8a16,
+        Precision.w16a16,
+        Precision.w4a16,
+        Precision.w4,
+        Precision.w8a8_mixed_int16,
+        Precision.w8a16_mixed_int16,
+        Precision.w8a8_mixed_fp16,
+        Precision.w8a16_mixed_fp16,
+    )
+}
+
 
 @unique
 class SourceModelFormat(Enum):
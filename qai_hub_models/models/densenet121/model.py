@@ -5,6 +5,10 @@
 
 from __future__ import annotations
 
+import copy
+import functools
+
+import torch
 import torchvision.models as tv_models
 
 from qai_hub_models.models._shared.imagenet_classifier.model import ImagenetClassifier
@@ -13,10 +17,17 @@ MODEL_ID = __name__.split(".")[-2]
 DEFAULT_WEIGHTS = "IMAGENET1K_V1"
 
 
+@functools.lru_cache(maxsize=4)
+def _load_densenet121(weights: str) -> torch.nn.Module:
+    """Load torchvision DenseNet121 weights once per process. The returned network is shared; do not modify it."""
+    return tv_models.densenet121(weights=weights)
+
+
 class DenseNet(ImagenetClassifier):
     @classmethod
     def from_pretrained(cls, weights: str = DEFAULT_WEIGHTS) -> DenseNet:
-        net = tv_models.densenet121(weights=weights)
+        # Callers may modify the network (eg. quantize it), so each model gets its own copy.
+        net = copy.deepcopy(_load_densenet121(weights))
         return cls(net)
 
     @staticmethod
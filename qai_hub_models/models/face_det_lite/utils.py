@@ -117,36 +117,74 @@ def detect(
     nms_iou: float = 0.2,
     stride: int = 8,
 ) -> list[BBox]:
+    return detect_batched(hm, box, landmark, threshold, nms_iou, stride)[0]
+
+
+def detect_batched(
+    hm: torch.Tensor,
+    box: torch.Tensor,
+    landmark: torch.Tensor,
+    threshold: float = 0.2,
+    nms_iou: float = 0.2,
+    stride: int = 8,
+) -> list[list[BBox]]:
+    """
+    Decode face detections for every image in a batch.
+
+    The heatmap peak search (sigmoid, max pool, top-k) runs once over the whole batch.
+    Decoding and NMS then run per image.
+
+    Parameters
+    ----------
+    hm
+        Heatmap, with shape [B, 1, H, W].
+    box
+        Box regression, with shape [B, 4, H, W].
+    landmark
+        Landmark regression, with shape [B, 10, H, W].
+    threshold
+        Minimum detection score.
+    nms_iou
+        IoU threshold for NMS. If -1, NMS is skipped.
+    stride
+        Stride of the heatmap relative to the network input.
+
+    Returns
+    -------
+    dets
+        The detections of each image in the batch.
+    """
+    batch_size = hm.shape[0]
     hm = hm.sigmoid()
     hm_pool = F.max_pool2d(hm, 3, 1, 1)
-    lens = ((hm == hm_pool).float() * hm).view(1, -1).cpu().shape[1]
-    scores_pt, indices = (
-        ((hm == hm_pool).float() * hm).view(1, -1).cpu().topk(min(lens, 2000))
-    )
-
-    hm_height, hm_width = hm.shape[2:]
-
-    scores_pt = scores_pt.squeeze()
-    indices = indices.squeeze()
-    ys = list(torch.div(indices, hm_width).int().data.numpy())
-    xs = list((indices % hm_width).int().data.numpy())
-    scores: list[float] = list(scores_pt.data.numpy())
-
-    objs = []
-    for cx, cy, score in zip(xs, ys, scores):
-        if score < threshold:
-            break
-
-        x, y, r, b = box[0, :, cy, cx].cpu().data.numpy()
-        xyrb: list[int] = (
-            (np.array([cx, cy, cx, cy]) + [-x, -y, r, b]) * stride
-        ).tolist()
-        x5y5 = landmark[0, :, cy, cx].cpu().data.numpy()
-        x5y5 = (x5y5 + ([cx] * 5 + [cy] * 5)) * stride
-
-        box_landmark = list(zip(x5y5[:5], x5y5[5:]))
-        objs.append(BBox("0", xyrb=xyrb, score=score, landmark=box_landmark))
-
-    if nms_iou != -1:
-        return nms(objs, iou=nms_iou)
-    return objs
+    peaks = ((hm == hm_pool).float() * hm).view(batch_size, -1).cpu()
+    scores_pt, indices = peaks.topk(min(peaks.shape[1], 2000), dim=-1)
+
+    hm_width = hm.shape[3]
+    all_ys = torch.div(indices, hm_width).int().numpy()
+    all_xs = (indices % hm_width).int().numpy()
+    all_scores = scores_pt.numpy()
+
+    # Copy the regression outputs to host memory once, rather than once per detection.
+    box_np = box.detach().cpu().numpy()
+    landmark_np = landmark.detach().cpu().numpy()
+
+    dets: list[list[BBox]] = []
+    for i in range(batch_size):
+        objs = []
+        for cx, cy, score in zip(all_xs[i], all_ys[i], all_scores[i]):
+            if score < threshold:
+                break
+
+            x, y, r, b = box_np[i, :, cy, cx]
+            xyrb: list[int] = (
+                (np.array([cx, cy, cx, cy]) + [-x, -y, r, b]) * stride
+            ).tolist()
+            x5y5 = landmark_np[i, :, cy, cx]
+            x5y5 = (x5y5 + ([cx] * 5 + [cy] * 5)) * stride
+
+            box_landmark = list(zip(x5y5[:5], x5y5[5:]))
+            objs.append(BBox("0", xyrb=xyrb, score=score, landmark=box_landmark))
+
+        dets.append(nms(objs, iou=nms_iou) if nms_iou != -1 else objs)
+    return dets
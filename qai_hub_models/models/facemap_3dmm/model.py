@@ -17,7 +17,7 @@ from qai_hub_models.utils.asset_loaders import (
     load_torch,
 )
 from qai_hub_models.utils.base_model import BaseModel
-from qai_hub_models.utils.image_processing import app_to_net_image_inputs
+from qai_hub_models.utils.image_processing import preprocess_PIL_image
 from qai_hub_models.utils.input_spec import InputSpec, SampleInputsType
 
 MODEL_ID = __name__.split(".")[-2]
@@ -46,6 +46,11 @@ class FaceMap_3DMM(BaseModel):
         resnet_model.load_state_dict(pretrained_dict)
         resnet_model.to(torch.device("cpu")).eval()
 
+        # The network expects pixel values in range [0, 255]. Its first layer is a 1x1 conv,
+        # so scale its weights rather than scaling every input image in forward().
+        with torch.no_grad():
+            resnet_model.rgb2gray_block.conv.weight.mul_(255)
+
         return cls(resnet_model)
 
     def forward(self, image):
@@ -62,7 +67,7 @@ class FaceMap_3DMM(BaseModel):
         -------
             3DMM model parameters for facial landmark reconstruction: Shape [batch, 265]
         """
-        return self.model(image * 255)
+        return self.model(image)
 
     @staticmethod
     def get_input_spec(
@@ -79,7 +84,7 @@ class FaceMap_3DMM(BaseModel):
         if input_spec is not None:
             h, w = input_spec["image"][0][2:]
             image = image.resize((w, h))
-        return {"image": [app_to_net_image_inputs(image)[1].numpy()]}
+        return {"image": [preprocess_PIL_image(image).numpy()]}
 
     @staticmethod
     def get_output_names() -> list[str]:
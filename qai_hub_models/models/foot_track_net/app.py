@@ -60,7 +60,7 @@ def restructure_topk(scores: torch.Tensor, K: int = 20) -> tuple[torch.Tensor, .
     batch, cat, height, width = scores.size()
 
     topk_scores, topk_inds = torch.topk(
-        scores.reshape(batch, -1), min(K, batch * cat * height * width)
+        scores.reshape(batch, -1), min(K, cat * height * width)
     )
     topk_clses = (topk_inds // (height * width)).int()
 
@@ -229,24 +229,61 @@ def detect_images_multiclass_fb(
         stride: the stride of the output map comparing to input.
         n_lmk: the landmark number.
     return:
-        detection result: list[BBox_landmarks]
+        detection result for the first image in the batch: list[BBox_landmarks]
+
+    """
+    return detect_images_multiclass_fb_batched(
+        output_hm[:1],
+        output_tlrb[:1],
+        output_landmark[:1],
+        vis[:1],
+        threshold=threshold,
+        stride=stride,
+        n_lmk=n_lmk,
+    )[0]
+
+
+def detect_images_multiclass_fb_batched(
+    output_hm: torch.Tensor,
+    output_tlrb: torch.Tensor,
+    output_landmark: torch.Tensor,
+    vis: torch.Tensor,
+    threshold: list | np.ndarray | None = None,
+    stride: int = 4,
+    n_lmk: int = 17,
+) -> list[list[BBox_landmarks]]:
+    """
+    Get the detection result of every image in the batch from the model raw output tensors.
+    Top-k and the copies to host memory run once for the whole batch.
+
+    Parameters
+    ----------
+        output_hm: N,C,H,W the model heatmap output.
+        output_tlrb: N,12,H,W the model bbox output.
+        output_landmark: N,34,H,W the model output_landmark output.
+        vis: N,17,H,W the model visiblity output
+        threshold: 3 the threshold for each class.
+        stride: the stride of the output map comparing to input.
+        n_lmk: the landmark number.
+    return:
+        detection result of each image: list[list[BBox_landmarks]]
 
     """
     if threshold is None:
         threshold = [0.7, 0.7, 0.7]
-    _, num_classes, hm_height, hm_width = output_hm.shape
-    hm = output_hm[0].reshape(1, num_classes, hm_height, hm_width)
-    hm = hm[:, :2]
+    batch_size, num_classes, hm_height, hm_width = output_hm.shape
+    hm = output_hm[:, :2]
 
     tlrb = (
-        output_tlrb[0]
-        .cpu()
+        output_tlrb.cpu()
         .data.numpy()
-        .reshape(1, num_classes * 4, hm_height, hm_width)
+        .reshape(batch_size, num_classes * 4, hm_height, hm_width)
     )
 
-    landmark = output_landmark[0].cpu().data.numpy().reshape(1, -1, hm_height, hm_width)
-    vis_np = vis[0].cpu().data.numpy().reshape(1, -1, hm_height, hm_width)
+    landmark = (
+        output_landmark.cpu().data.numpy().reshape(batch_size, -1, hm_height, hm_width)
+    )
+    vis_np = vis.cpu().data.numpy().reshape(batch_size, -1, hm_height, hm_width)
     nmskey = hm
 
     kscore_pt, kinds_pt, kcls_pt, kys_pt, kxs_pt = restructure_topk(nmskey, 1000)
@@ -255,31 +292,26 @@ def detect_images_multiclass_fb(
     kxs = kxs_pt.cpu().data.numpy().astype(np.int32)
     kcls = kcls_pt.cpu().data.numpy().astype(np.int32)
     kscore = kscore_pt.cpu().data.numpy().astype(np.float32)
-    kinds = kinds_pt.cpu().data.numpy().astype(np.int32)
-
-    key: list[list[np.ndarray]] = [
-        [],  # [kys..]
-        [],  # [kxs..]
-        [],  # [score..]
-        [],  # [class..]
-        [],  # [kinds..]
-    ]
-
-    score_fc = []
-    for ind in range(kscore.shape[1]):
-        score = kscore[0, ind]
-        thr = threshold[kcls[0, ind]]
-        if kcls[0, ind] == 0:
-            score_fc.append(kscore[0, ind])
-        if score > thr:
-            key[0].append(kys[0, ind])
-            key[1].append(kxs[0, ind])
-            key[2].append(score)
-            key[3].append(kcls[0, ind])
-            key[4].append(kinds[0, ind])
-
-    imboxs = []
-    if key[0] is not None and len(key[0]) > 0:
+
+    all_imboxs: list[list[BBox_landmarks]] = []
+    for b in range(batch_size):
+        key: list[list[np.ndarray]] = [
+            [],  # [kys..]
+            [],  # [kxs..]
+            [],  # [score..]
+            [],  # [class..]
+        ]
+
+        for ind in range(kscore.shape[1]):
+            score = kscore[b, ind]
+            thr = threshold[kcls[b, ind]]
+            if score > thr:
+                key[0].append(kys[b, ind])
+                key[1].append(kxs[b, ind])
+                key[2].append(score)
+                key[3].append(kcls[b, ind])
+
+        imboxs = []
         ky, kx = key[0], key[1]
         classes = key[3]
         scores = key[2]
@@ -287,16 +319,16 @@ def detect_images_multiclass_fb(
         for i in range(len(kx)):
             class_ = int(classes[i])
             cx, cy = kx[i], ky[i]
-            x1, y1, x2, y2 = tlrb[0, class_ * 4 : (class_ + 1) * 4, cy, cx]
+            x1, y1, x2, y2 = tlrb[b, class_ * 4 : (class_ + 1) * 4, cy, cx]
             x1, y1, x2, y2 = (
                 np.array([cx, cy, cx, cy]) + np.array([-x1, -y1, x2, y2])
             ) * stride  # back to world
 
             if class_ == 1:  # face person, only person has landmark otherwise None
-                x5y5 = landmark[0, : n_lmk * 2, cy, cx]
+                x5y5 = landmark[b, : n_lmk * 2, cy, cx]
                 x5y5 = (x5y5 + np.array([cx] * n_lmk + [cy] * n_lmk)) * stride
                 boxlandmark = np.array(list(zip(x5y5[:n_lmk], x5y5[n_lmk:])))
-                box_vis = vis_np[0, :, cy, cx].tolist()
+                box_vis = vis_np[b, :, cy, cx].tolist()
             else:
                 boxlandmark = None
                 box_vis = None
@@ -309,7 +341,8 @@ def detect_images_multiclass_fb(
                     vis=box_vis,
                 )
             )
-    return imboxs
+        all_imboxs.append(imboxs)
+    return all_imboxs
 
 
 def postprocess(
@@ -332,9 +365,39 @@ def postprocess(
         face result: list[BBox_landmarks]
         person result: list[BBox_landmarks]
     """
+    return postprocess_batched(
+        heatmap[:1],
+        bbox[:1],
+        landmark[:1],
+        landmark_visibility[:1],
+        threshhold,
+        iou_thr,
+    )[0]
+
+
+def postprocess_batched(
+    heatmap: torch.Tensor,
+    bbox: torch.Tensor,
+    landmark: torch.Tensor,
+    landmark_visibility: torch.Tensor,
+    threshhold: list[float],
+    iou_thr: list[float],
+) -> list[tuple[list[BBox_landmarks], list[BBox_landmarks]]]:
+    """
+    Get the detection result of every image in the batch from the model raw output tensors.
+
+    Parameters
+    ----------
+        output: N,C,H,W the model heatmap/bbox/output_landmark/visiblity output.
+        threshold: 3 the threshold for each class.
+        iou_thr: 3 the iou threshold for each class.
+    return:
+        list of (face result: list[BBox_landmarks], person result: list[BBox_landmarks]),
+        one per image.
+    """
     stride = 4
     num_landmarks = 17
-    objs = detect_images_multiclass_fb(
+    all_objs = detect_images_multiclass_fb_batched(
         heatmap,
         bbox,
         landmark,
@@ -344,20 +407,34 @@ def postprocess(
         vis=landmark_visibility,
     )
 
-    objs_face = []
-    objs_person = []
+    face_label = str(CLASSNAME_TO_ID_MAP["face"])
+    person_label = str(CLASSNAME_TO_ID_MAP["person"])
+    results = []
+    for objs in all_objs:
+        objs_face = [obj for obj in objs if obj.label == face_label]
+        objs_person = [obj for obj in objs if obj.label == person_label]
+        results.append(
+            (
+                nms_bbox_landmark(objs_face, iou=iou_thr[0]),
+                nms_bbox_landmark(objs_person, iou=iou_thr[1]),
+            )
+        )
+    return results
 
-    for obj in objs:
-        label = id_to_classname(int(obj.label_prop))
-        if label == "face":
-            objs_face.append(obj)
-        elif label == "person":
-            objs_person.append(obj)
 
-    objs_face = nms_bbox_landmark(objs_face, iou=iou_thr[0])
-    objs_person = nms_bbox_landmark(objs_person, iou=iou_thr[1])
+def bbox_landmarks_to_array(objs: list[BBox_landmarks]) -> np.ndarray:
+    """
+    Stack the boxes and scores of the given detections into one array.
 
-    return objs_face, objs_person
+    Parameters
+    ----------
+        objs: the detections, eg. the face or person result of postprocess.
+    return:
+        K,5 float64 array; each row is (x, y, r, b, score).
+    """
+    return np.array(
+        [(obj.x, obj.y, obj.r, obj.b, obj.score) for obj in objs], dtype=np.float64
+    ).reshape(-1, 5)
 
 
 def undo_resize_pad_bbox(bbox: BBox_landmarks, scale: float, padding: tuple[int, int]):
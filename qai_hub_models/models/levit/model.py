@@ -5,6 +5,9 @@
 
 from __future__ import annotations
 
+import copy
+import functools
+
 import torch
 from transformers import LevitForImageClassification
 
@@ -18,12 +21,19 @@ MODEL_ASSET_VERSION = 2
 DEFAULT_WEIGHTS = "facebook/levit-128S"
 
 
+@functools.lru_cache(maxsize=4)
+def _load_levit(ckpt_name: str) -> LevitForImageClassification:
+    """Load a LeViT checkpoint once per process. The returned network is shared; do not modify it."""
+    return LevitForImageClassification.from_pretrained(ckpt_name)
+
+
 class LeViT(ImagenetClassifier):
     """Exportable LeViT model, end-to-end."""
 
     @classmethod
     def from_pretrained(cls, ckpt_name: str = DEFAULT_WEIGHTS) -> LeViT:
-        model = LevitForImageClassification.from_pretrained(ckpt_name)
+        # Callers may modify the network (eg. quantize it), so each model gets its own copy.
+        model = copy.deepcopy(_load_levit(ckpt_name))
         return cls(model)
 
     def forward(self, image: torch.Tensor) -> torch.Tensor:
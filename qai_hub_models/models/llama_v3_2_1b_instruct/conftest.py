@@ -4,6 +4,7 @@
 # ---------------------------------------------------------------------
 import gc
 import inspect
+import weakref
 
 import pytest
 
@@ -16,18 +17,29 @@ from qai_hub_models.models.llama_v3_2_1b_instruct import Model
 @pytest.fixture(scope="module", autouse=True)
 def cached_from_pretrained():
     with pytest.MonkeyPatch.context() as mp:
-        pretrained_cache: dict[str, Model] = {}
+        # Models are held weakly, except for the most recently returned one. Consecutive tests
+        # with the same arguments share a model, but models for other arguments can be freed.
+        pretrained_cache: weakref.WeakValueDictionary[tuple | str, Model] = (
+            weakref.WeakValueDictionary()
+        )
+        last_model: list[Model] = []
         from_pretrained = Model.from_pretrained
         sig = inspect.signature(from_pretrained)
 
         def _cached_from_pretrained(*args, **kwargs):
-            cache_key = str(args) + str(kwargs)
+            # Key on the arguments themselves, so a cache hit only needs to hash them.
+            # Fall back to their repr if any argument is unhashable.
+            cache_key: tuple | str = (args, tuple(sorted(kwargs.items())))
+            try:
+                hash(cache_key)
+            except TypeError:
+                cache_key = repr(cache_key)
             model = pretrained_cache.get(cache_key)
-            if model:
-                return model
-            non_none_model = from_pretrained(*args, **kwargs)
-            pretrained_cache[cache_key] = non_none_model  # type: ignore[assignment]
-            return non_none_model
+            if not model:
+                model = from_pretrained(*args, **kwargs)
+                pretrained_cache[cache_key] = model  # type: ignore[assignment]
+            last_model[:] = [model]
+            return model
 
         _cached_from_pretrained.__signature__ = sig  # type: ignore[attr-defined]
 
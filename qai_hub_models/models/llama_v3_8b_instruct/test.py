@@ -4,8 +4,10 @@
 # ---------------------------------------------------------------------
 from __future__ import annotations
 
+import functools
 import importlib
 import os
+from collections.abc import Callable, Iterator
 from pathlib import Path
 from typing import Any
 
@@ -55,11 +57,35 @@ from qai_hub_models.utils.testing_export_eval import compile_via_export
 DEFAULT_EVAL_SEQLEN = 2048
 
 
+@pytest.fixture(scope="module")
+def fp_model_loader() -> Iterator[Callable[[], FP_Model]]:
+    """
+    Get a function that loads the floating point model shared by every test_compile case.
+
+    The checkpoint is loaded on the first call and reused after that, so if every case is skipped
+    it is never loaded. Each pytest-xdist worker is a separate process with its own instance of
+    this fixture, so each worker loads the model at most once.
+    """
+
+    @functools.cache
+    def _load() -> FP_Model:
+        return FP_Model.from_pretrained(
+            sequence_length=128, context_length=DEFAULT_CONTEXT_LENGTH
+        )
+
+    yield _load
+    _load.cache_clear()
+    cleanup()
+
+
 def test_create_genie_config():
     model_name = "meta-llama/Meta-Llama-3-8B-Instruct"
     context_length = 2048
     llm_config = AutoConfig.from_pretrained(model_name)
-    model_list = [f"llama_v3_8b_instruct_part_{i}_of_5.bin" for i in range(1, 6)]
+    model_list = [
+        f"llama_v3_8b_instruct_part_{i}_of_{NUM_SPLITS}.bin"
+        for i in range(1, NUM_SPLITS + 1)
+    ]
     actual_config = create_genie_config(context_length, llm_config, "rope", model_list)
     expected_config: dict[str, Any] = {
         "dialog": {
@@ -309,9 +335,11 @@ def test_compile(
     precision: Precision,
     scorecard_path: ScorecardCompilePath,
     device: ScorecardDevice,
+    fp_model_loader: Callable[[], FP_Model],
 ) -> None:
     cleanup()
     allow_few_test_devices_for_llms(scorecard_path.runtime, device)
+    fp_model = fp_model_loader()
     genie_bundle_path = f"genie_bundle/{MODEL_ID}/{device.name}_{str(precision)}"
     compile_via_export(
         export_model,
@@ -330,9 +358,7 @@ def test_compile(
             num_splits=NUM_SPLITS,
             num_layers_per_split=NUM_LAYERS_PER_SPLIT,
             output_dir=genie_bundle_path,
-            fp_model=FP_Model.from_pretrained(
-                sequence_length=128, context_length=DEFAULT_CONTEXT_LENGTH
-            ),
+            fp_model=fp_model,
             position_processor_cls=PositionProcessor,
         ),
         skip_compile_options=True,
@@ -225,7 +225,7 @@ class ProfileScorecardJob(ScorecardJob[hub.ProfileJob, ScorecardProfilePath]):
         gpu = _count_unit("GPU")
         npu = _count_unit("NPU")
 
-        return QAIHMModelPerf.PerformanceDetails.LayerCounts.from_layers(npu, gpu, cpu)
+        return QAIHMModelPerf.PerformanceDetails.layer_counts_from_layers(npu, gpu, cpu)
 
     @cached_property
     def estimated_peak_memory_range_mb(
@@ -235,7 +235,7 @@ class ProfileScorecardJob(ScorecardJob[hub.ProfileJob, ScorecardProfilePath]):
         low, high = self.profile_results["execution_summary"][
             "inference_memory_peak_range"
         ]
-        return QAIHMModelPerf.PerformanceDetails.PeakMemoryRangeMB.from_bytes(low, high)
+        return QAIHMModelPerf.PerformanceDetails.peak_memory_range_from_bytes(low, high)
 
     @cached_property
     def performance_metrics(self) -> QAIHMModelPerf.PerformanceDetails:
@@ -248,9 +248,6 @@ class ProfileScorecardJob(ScorecardJob[hub.ProfileJob, ScorecardProfilePath]):
             estimated_peak_memory_range_mb=(
                 self.estimated_peak_memory_range_mb if self.success else None
             ),
-            primary_compute_unit=(
-                self.layer_counts.primary_compute_unit if self.success else None
-            ),
             layer_counts=self.layer_counts if self.success else None,
             tool_versions=self.tool_versions,
         )
@@ -317,9 +317,9 @@ class ResultsSpreadsheet(list):
                     inference_time = profile_job.inference_time_milliseconds
                     first_load_time = profile_job.first_load_time_milliseconds
                     warm_load_time = profile_job.warm_load_time_milliseconds
-                    NPU = profile_job.layer_counts.npu
-                    GPU = profile_job.layer_counts.gpu
-                    CPU = profile_job.layer_counts.cpu
+                    NPU = profile_job.layer_counts.get("npu", 0)
+                    GPU = profile_job.layer_counts.get("gpu", 0)
+                    CPU = profile_job.layer_counts.get("cpu", 0)
                 else:
                     inference_time = None
                     first_load_time = None
@@ -4,6 +4,8 @@
 # ---------------------------------------------------------------------
 from typing import Optional
 
+import pytest
+
 from qai_hub_models.configs.devices_and_chipsets_yaml import (
     SCORECARD_DEVICE_YAML_PATH,
     DevicesAndChipsetsYaml,
@@ -11,7 +13,7 @@ from qai_hub_models.configs.devices_and_chipsets_yaml import (
 )
 from qai_hub_models.configs.info_yaml import QAIHMModelInfo
 from qai_hub_models.configs.perf_yaml import QAIHMModelPerf
-from qai_hub_models.utils.path_helpers import MODEL_IDS
+from qai_hub_models.utils.path_helpers import MODEL_IDS, QAIHM_MODELS_ROOT
 
 
 def test_perf_yaml():
@@ -70,10 +72,54 @@ def test_perf_yaml():
                                 is not None
                             ):
                                 assert (
-                                    performance_details.time_to_first_token_range_milliseconds.max
-                                    >= performance_details.time_to_first_token_range_milliseconds.min
+                                    performance_details.time_to_first_token_range_milliseconds[
+                                        "max"
+                                    ]
+                                    >= performance_details.time_to_first_token_range_milliseconds[
+                                        "min"
+                                    ]
                                 )
     except Exception as err:
         raise AssertionError(
             f"{model_id} perf yaml validation failed: {str(err)}"
         ) from None
+
+
+@pytest.mark.parametrize(
+    "model_id", ["resnet18", "whisper_tiny", "llama_v3_2_3b_instruct"]
+)
+def test_trusted_perf_yaml_matches_validated(model_id: str):
+    validated = QAIHMModelPerf.from_yaml(QAIHM_MODELS_ROOT / model_id / "perf.yaml")
+    trusted = QAIHMModelPerf.from_model_unvalidated(model_id)
+
+    assert trusted.model_dump() == validated.model_dump()
+    assert trusted.supported_devices == validated.supported_devices
+
+    trusted_entries = list(trusted.entries())
+    validated_entries = list(validated.entries())
+    assert len(trusted_entries) > 0
+    assert trusted_entries == validated_entries
+    for trusted_entry, validated_entry in zip(trusted_entries, validated_entries):
+        assert [type(x) for x in trusted_entry] == [type(x) for x in validated_entry]
+        trusted_details, validated_details = trusted_entry[-1], validated_entry[-1]
+        assert type(trusted_details.tool_versions.qairt) is type(
+            validated_details.tool_versions.qairt
+        )
+
+
+def test_performance_details_fills_primary_compute_unit():
+    details = QAIHMModelPerf.PerformanceDetails(
+        job_id="jabc123",
+        job_status="Passed",
+        layer_counts={"total": 10, "npu": 2, "gpu": 7, "cpu": 1},
+    )
+    assert details.primary_compute_unit == "GPU"
+
+    # An explicitly set compute unit is kept.
+    details = QAIHMModelPerf.PerformanceDetails(
+        job_id="jabc123",
+        job_status="Passed",
+        layer_counts={"total": 10, "npu": 2, "gpu": 7, "cpu": 1},
+        primary_compute_unit="NPU",
+    )
+    assert details.primary_compute_unit == "NPU"
@@ -0,0 +1,60 @@
+# ---------------------------------------------------------------------
+# Copyright (c) 2025 Qualcomm Technologies, Inc. and/or its subsidiaries.
+# SPDX-License-Identifier: BSD-3-Clause
+# ---------------------------------------------------------------------
+
+from __future__ import annotations
+
+from collections.abc import Iterator
+
+import pytest
+import torch
+
+from qai_hub_models.evaluators.base_evaluators import _for_each_batch
+
+
+class _CountingData:
+    """Dataset of (input, ground truth) batches that records how many batches were read."""
+
+    def __init__(self, num_batches: int, fail_at: int | None = None):
+        self.num_batches = num_batches
+        self.fail_at = fail_at
+        self.num_read = 0
+
+    def __len__(self) -> int:
+        return self.num_batches
+
+    def __iter__(self) -> Iterator[tuple[torch.Tensor, torch.Tensor]]:
+        for i in range(self.num_batches):
+            if i == self.fail_at:
+                raise RuntimeError(f"Failed to load batch {i}")
+            self.num_read += 1
+            yield torch.full((1, 2), float(i)), torch.tensor([i])
+
+
+def test_num_samples_truncation():
+    data = _CountingData(10)
+    seen_gt: list[int] = []
+    _for_each_batch(
+        torch.nn.Identity(),
+        data,
+        num_samples=3,
+        data_has_gt=True,
+        callback=lambda _, __, gt: seen_gt.append(int(gt)),
+    )
+    assert seen_gt == [0, 1, 2]
+    # Batches past num_samples are never loaded.
+    assert data.num_read == 3
+
+
+def test_exception_propagation():
+    data = _CountingData(10, fail_at=3)
+    seen_gt: list[int] = []
+    with pytest.raises(RuntimeError, match="Failed to load batch 3"):
+        _for_each_batch(
+            torch.nn.Identity(),
+            data,
+            data_has_gt=True,
+            callback=lambda _, __, gt: seen_gt.append(int(gt)),
+        )
+    assert seen_gt == [0, 1, 2]
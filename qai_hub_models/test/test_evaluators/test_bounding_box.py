@@ -0,0 +1,33 @@
+# ---------------------------------------------------------------------
+# Copyright (c) 2025 Qualcomm Technologies, Inc. and/or its subsidiaries.
+# SPDX-License-Identifier: BSD-3-Clause
+# ---------------------------------------------------------------------
+
+from __future__ import annotations
+
+import numpy as np
+from podm.metrics import BoundingBox
+
+from qai_hub_models.evaluators.utils.bounding_box import bounding_boxes_from_arrays
+
+
+def test_bounding_boxes_from_arrays():
+    xyxy = np.array([[0, 1, 10, 12], [5, 5, 6, 9.5]], dtype=np.float32)
+    categories = np.array([3, 7])
+    scores = np.array([0.25, 0.75], dtype=np.float32)
+
+    boxes = bounding_boxes_from_arrays("img", categories, xyxy, scores)
+    expected = [
+        BoundingBox.of_bbox("img", int(category), *box.tolist(), float(score))
+        for category, box, score in zip(categories, xyxy, scores)
+    ]
+    assert [vars(box) for box in boxes] == [vars(box) for box in expected]
+    assert [type(box.xtl) for box in boxes] == [float, float]
+    assert [type(box.category) for box in boxes] == [int, int]
+
+    # Scalars (including strings) apply to every box.
+    boxes = bounding_boxes_from_arrays(4, "face", xyxy, 1.0)
+    assert [box.category for box in boxes] == ["face", "face"]
+    assert [box.score for box in boxes] == [1.0, 1.0]
+
+    assert bounding_boxes_from_arrays(0, 0, np.zeros((0, 4)), 1.0) == []
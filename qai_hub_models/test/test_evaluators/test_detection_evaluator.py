@@ -0,0 +1,78 @@
+# ---------------------------------------------------------------------
+# Copyright (c) 2025 Qualcomm Technologies, Inc. and/or its subsidiaries.
+# SPDX-License-Identifier: BSD-3-Clause
+# ---------------------------------------------------------------------
+
+from __future__ import annotations
+
+import numpy as np
+import pytest
+from podm.metrics import BoundingBox
+
+from qai_hub_models.evaluators.detection_evaluator import DetectionEvaluator
+
+
+def _random_boxes(
+    rng: np.random.Generator, num_images: int, boxes_per_image: int, gt: bool
+) -> list[BoundingBox]:
+    boxes = []
+    for image_id in range(num_images):
+        xy = rng.uniform(0, 80, (boxes_per_image, 2))
+        wh = rng.uniform(5, 20, (boxes_per_image, 2))
+        categories = rng.integers(0, 3, boxes_per_image)
+        scores = np.ones(boxes_per_image) if gt else rng.uniform(0, 1, boxes_per_image)
+        boxes.extend(
+            BoundingBox.of_bbox(
+                image_id, int(category), x1, y1, x1 + w, y1 + h, float(score)
+            )
+            for (x1, y1), (w, h), category, score in zip(
+                xy.tolist(), wh.tolist(), categories, scores
+            )
+        )
+    return boxes
+
+
+def test_pooled_mAP_matches_sequential():
+    rng = np.random.default_rng(0)
+    gt_bbox = _random_boxes(rng, 8, 6, gt=True)
+    # Predictions are the ground truth boxes shifted by a random offset, plus some random false positives.
+    pred_bbox = [
+        BoundingBox.of_bbox(
+            box.image,
+            box.category,
+            *(np.array([box.xtl, box.ytl, box.xbr, box.ybr]) + np.tile(offset, 2)),
+            float(rng.uniform(0, 1)),
+        )
+        for box, offset in zip(gt_bbox, rng.normal(0, 2, (len(gt_bbox), 2)))
+    ] + _random_boxes(rng, 8, 3, gt=False)
+
+    sequential = DetectionEvaluator(100, 100)
+    sequential.store_bboxes_for_eval(gt_bbox, pred_bbox)
+    pooled = DetectionEvaluator(100, 100)
+    pooled.mAP_num_processes = 2
+    pooled.store_bboxes_for_eval(gt_bbox, pred_bbox)
+
+    expected = sequential.get_mAP()
+    assert 0 < expected[0] < 1
+    assert pooled.get_mAP() == expected
+
+
+def test_num_mAP_processes(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr("os.cpu_count", lambda: 4)
+    rng = np.random.default_rng(0)
+    evaluator = DetectionEvaluator(100, 100)
+
+    # Small evaluations compute mAP in this process.
+    evaluator.store_bboxes_for_eval([], _random_boxes(rng, 10, 10, gt=False))
+    assert evaluator._get_num_mAP_processes(10) == 1
+
+    # Large evaluations with enough (class, iOU) pairs use one process per CPU.
+    evaluator.store_bboxes_for_eval([], _random_boxes(rng, 500, 10, gt=False))
+    assert evaluator._get_num_mAP_processes(10) == 4
+    assert evaluator._get_num_mAP_processes(3) == 3
+    # 3 classes * 1 iOU is too few pairs.
+    assert evaluator._get_num_mAP_processes(1) == 1
+
+    # An explicit process count overrides the automatic choice.
+    evaluator.mAP_num_processes = 1
+    assert evaluator._get_num_mAP_processes(10) == 1
@@ -0,0 +1,84 @@
+# ---------------------------------------------------------------------
+# Copyright (c) 2025 Qualcomm Technologies, Inc. and/or its subsidiaries.
+# SPDX-License-Identifier: BSD-3-Clause
+# ---------------------------------------------------------------------
+
+from __future__ import annotations
+
+import pytest
+import torch
+
+from qai_hub_models.evaluators.segmentation_evaluator import (
+    SegmentationOutputEvaluator,
+)
+
+NUM_CLASSES = 5
+IGNORE_LABEL = 255
+
+
+def _reference_confusion_matrix(
+    gts: list[torch.Tensor], preds: list[torch.Tensor], num_classes: int
+) -> torch.Tensor:
+    """Confusion matrix computed with a per-batch bincount, as the evaluator originally did."""
+    confusion_matrix = torch.zeros((num_classes, num_classes))
+    for gt, pred in zip(gts, preds):
+        mask = (gt >= 0) & (gt < num_classes)
+        label = num_classes * gt[mask].int() + pred[mask].int()
+        count = torch.bincount(label, minlength=num_classes**2)
+        confusion_matrix += count.reshape(num_classes, num_classes)
+    return confusion_matrix
+
+
+def _make_batches(
+    gt_dtype: torch.dtype, num_batches: int = 3
+) -> tuple[list[torch.Tensor], list[torch.Tensor]]:
+    generator = torch.Generator().manual_seed(0)
+    gts, preds = [], []
+    for _ in range(num_batches):
+        gt = torch.randint(0, NUM_CLASSES, (2, 17, 23), generator=generator)
+        ignored = torch.rand(gt.shape, generator=generator) < 0.2
+        gt[ignored] = IGNORE_LABEL
+        gts.append(gt.to(gt_dtype))
+        preds.append(torch.randint(0, NUM_CLASSES, (2, 17, 23), generator=generator))
+    return gts, preds
+
+
+@pytest.mark.parametrize("gt_dtype", [torch.uint8, torch.int64, torch.float32])
+def test_confusion_matrix_matches_bincount(gt_dtype: torch.dtype):
+    gts, preds = _make_batches(gt_dtype)
+    evaluator = SegmentationOutputEvaluator(NUM_CLASSES)
+    for gt, pred in zip(gts, preds):
+        evaluator.add_batch(pred, gt)
+
+    expected = _reference_confusion_matrix(gts, preds, NUM_CLASSES)
+    torch.testing.assert_close(evaluator.confusion_matrix.float(), expected)
+    expected_iou = torch.diag(expected) / (
+        expected.sum(dim=1) + expected.sum(dim=0) - torch.diag(expected)
+    )
+    assert evaluator.get_accuracy_score() == pytest.approx(
+        torch.nanmean(expected_iou).item()
+    )
+
+
+def test_resize_to_gt_float_mask():
+    # Binary segmentation datasets (eg. Carvana) return float masks.
+    generator = torch.Generator().manual_seed(0)
+    logits = torch.rand((2, 2, 8, 8), generator=generator)
+    gt = (torch.rand((2, 16, 16), generator=generator) > 0.5).float()
+    evaluator = SegmentationOutputEvaluator(2, resize_to_gt=True)
+    evaluator.add_batch(logits, gt)
+
+    pred = torch.nn.functional.interpolate(logits, (16, 16), mode="bilinear").argmax(1)
+    expected = _reference_confusion_matrix([gt], [pred], 2)
+    torch.testing.assert_close(evaluator.confusion_matrix.float(), expected)
+
+
+def test_out_of_range_predictions_are_ignored():
+    gt = torch.tensor([[[0, 1, 2, IGNORE_LABEL]]])
+    pred = torch.tensor([[[0, NUM_CLASSES, 2, 1]]])
+    evaluator = SegmentationOutputEvaluator(NUM_CLASSES)
+    evaluator.add_batch(pred, gt)
+    expected = torch.zeros((NUM_CLASSES, NUM_CLASSES), dtype=torch.int64)
+    expected[0, 0] = 1
+    expected[2, 2] = 1
+    torch.testing.assert_close(evaluator.confusion_matrix, expected)
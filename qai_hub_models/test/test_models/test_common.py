@@ -4,6 +4,7 @@
 # ---------------------------------------------------------------------
 from __future__ import annotations
 
+import os
 from contextlib import contextmanager, nullcontext
 from unittest import mock
 
@@ -18,6 +19,7 @@ from qai_hub_models.models.common import (
     TargetRuntime,
 )
 from qai_hub_models.utils.base_config import BaseQAIHMConfig
+from qai_hub_models.utils.envvars import CacheAIHubFrameworksEnvvar
 
 
 class ConfigurationPropertyMock(mock.Mock):
@@ -57,6 +59,15 @@ def reset_hub_frameworks_patches(
         mock.patch(
             "qai_hub_models.models.common.QAIRTVersion._HUB_DEFAULT_FRAMEWORK", {}
         ),
+        # Use only the mocked frameworks, and don't write them to the on-disk cache.
+        mock.patch.dict(
+            os.environ,
+            {
+                CacheAIHubFrameworksEnvvar.VARNAME: CacheAIHubFrameworksEnvvar.serialize(
+                    False
+                )
+            },
+        ),
         mock.patch(
             "qai_hub.hub._global_client.config.api_url",
             "https://app.aihub.qualcomm.com",
@@ -67,6 +78,23 @@ def reset_hub_frameworks_patches(
         yield
 
 
+def test_runtime_properties_cover_all_members():
+    for engine in InferenceEngine:
+        assert engine.full_package_name
+    for runtime in TargetRuntime:
+        assert runtime.inference_engine in InferenceEngine
+        assert runtime.file_extension
+        assert isinstance(runtime.channel_last_native_execution, bool)
+        if runtime.is_exclusively_for_genai:
+            with pytest.raises(ValueError, match="No Hub model type"):
+                _ = runtime.hub_model_type
+        else:
+            assert TargetRuntime.from_hub_model_type(runtime.hub_model_type) in (
+                runtime,
+                TargetRuntime.ONNX,
+            )
+
+
 def test_precision_has_float():
     assert not Precision.float.has_quantized_activations
     assert Precision.float.has_float_activations
@@ -153,6 +181,20 @@ def test_precision_parse_serialize():
         Precision(QuantizeDtype.INT8, QuantizeDtype.INT8, QuantizeDtype.INT8)
 
 
+def test_precision_pydantic():
+    class PrecisionConfig(BaseQAIHMConfig):
+        precision: Precision
+
+    config = PrecisionConfig.model_validate({"precision": "a16w8_mixed_int16"})
+    assert config.precision == Precision.w8a16_mixed_int16
+    assert PrecisionConfig(precision=Precision.w8a8).precision == Precision.w8a8
+    assert config.model_dump_json() == '{"precision":"w8a16_mixed_int16"}'
+    assert PrecisionConfig.model_json_schema()["properties"]["precision"] == {
+        "title": "Precision",
+        "type": "string",
+    }
+
+
 def test_qairt_version():
     # Patch frameworks so this test continues to work regardless of AI Hub version changes.
     frameworks = [
@@ -13,7 +13,7 @@ from typing import Any, Generic
 import ruamel.yaml
 from pydantic import BaseModel, ConfigDict, GetCoreSchemaHandler
 from pydantic_core import core_schema
-from pydantic_yaml import parse_yaml_file_as, to_yaml_file
+from pydantic_yaml import to_yaml_file
 from ruamel.yaml.representer import RoundTripRepresenter
 from typing_extensions import TypeVar
 
@@ -104,7 +104,19 @@ class BaseQAIHMConfig(BaseModel):
             not os.path.exists(path) or os.path.getsize(path) == 0
         ):
             return cls()
-        return parse_yaml_file_as(cls, path)
+        return cls.model_validate(load_yaml(path))
+
+
+def load_yaml(path: str | Path) -> Any:
+    """
+    Load the YAML file at the given path into python objects.
+
+    Uses ruamel's libyaml-backed C parser when it is available (it falls back
+    to the pure-python parser otherwise). This is several times faster than the
+    pure-python parser used by pydantic_yaml, and resolves values the same way.
+    """
+    with open(path) as f:
+        return ruamel.yaml.YAML(typ="safe").load(f)
 
 
 BaseQAIHMConfigTypeVar = TypeVar("BaseQAIHMConfigTypeVar", bound=BaseQAIHMConfig)
@@ -15,3 +15,37 @@ class IsOnCIEnvvar(QAIHMBoolEnvvar):
     @classmethod
     def default(cls):
         return False
+
+
+class TrustPerfYamlEnvvar(QAIHMBoolEnvvar):
+    """
+    If this is true, perf.yaml files are loaded without validation.
+
+    Only set this when the perf.yaml files on disk were written by AI Hub Models tooling
+    (which validates them on write), such as in bulk scorecard processing.
+    """
+
+    VARNAME = "QAIHM_TRUST_PERF_YAML"
+    CLI_ARGNAMES = ["--trust-perf-yaml"]
+    CLI_HELP_MESSAGE = "If set, perf.yaml files are loaded without validation."
+
+    @classmethod
+    def default(cls):
+        return False
+
+
+class CacheAIHubFrameworksEnvvar(QAIHMBoolEnvvar):
+    """
+    If this is true, the list of QAIRT versions available on AI Hub is cached on disk for a short time,
+    so that each new process does not need to fetch it from AI Hub again.
+    """
+
+    VARNAME = "QAIHM_CACHE_AIHUB_FRAMEWORKS"
+    CLI_ARGNAMES = ["--cache-aihub-frameworks"]
+    CLI_HELP_MESSAGE = (
+        "If set, the QAIRT versions available on AI Hub are briefly cached on disk."
+    )
+
+    @classmethod
+    def default(cls):
+        return True
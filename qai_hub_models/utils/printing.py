@@ -113,10 +113,10 @@ def print_profile_metrics_from_job(
         job_id=profile_job.job_id,
         inference_time_milliseconds=execution_summary["estimated_inference_time"]
         / 1000,
-        estimated_peak_memory_range_mb=QAIHMModelPerf.PerformanceDetails.PeakMemoryRangeMB.from_bytes(
+        estimated_peak_memory_range_mb=QAIHMModelPerf.PerformanceDetails.peak_memory_range_from_bytes(
             low_mem_bytes, high_mem_bytes
         ),
-        layer_counts=QAIHMModelPerf.PerformanceDetails.LayerCounts.from_layers(
+        layer_counts=QAIHMModelPerf.PerformanceDetails.layer_counts_from_layers(
             npu=compute_unit_counts.get("npu", 0),
             gpu=compute_unit_counts.get("gpu", 0),
             cpu=compute_unit_counts.get("cpu", 0),
@@ -158,7 +158,7 @@ def get_profile_metrics(
                 ],
                 [
                     "Time to First Token (Seconds)",
-                    f"min={perf_details.time_to_first_token_range_milliseconds.min / 1000}, max={perf_details.time_to_first_token_range_milliseconds.max / 100}",
+                    f"min={perf_details.time_to_first_token_range_milliseconds['min'] / 1000}, max={perf_details.time_to_first_token_range_milliseconds['max'] / 100}",
                 ],
             ]
         )
@@ -167,14 +167,14 @@ def get_profile_metrics(
         assert perf_details.estimated_peak_memory_range_mb
         assert perf_details.layer_counts
         inf_time_ms = perf_details.inference_time_milliseconds
-        mem_min = perf_details.estimated_peak_memory_range_mb.min
-        mem_max = perf_details.estimated_peak_memory_range_mb.max
+        mem_min = perf_details.estimated_peak_memory_range_mb["min"]
+        mem_max = perf_details.estimated_peak_memory_range_mb["max"]
         compute_units = [
             f"{unit} ({num_ops} ops)"
             for unit, num_ops in [
-                ("npu", perf_details.layer_counts.npu),
-                ("gpu", perf_details.layer_counts.gpu),
-                ("cpu", perf_details.layer_counts.cpu),
+                ("npu", perf_details.layer_counts.get("npu", 0)),
+                ("gpu", perf_details.layer_counts.get("gpu", 0)),
+                ("cpu", perf_details.layer_counts.get("cpu", 0)),
             ]
         ]
 
@@ -185,7 +185,7 @@ def get_profile_metrics(
                     "<0.1" if inf_time_ms < 0.1 else f"{inf_time_ms:.1f}",
                 ],
                 ["Estimated peak memory usage (MB)", f"[{mem_min}, {mem_max}]"],
-                ["Total # Ops", str(perf_details.layer_counts.total)],
+                ["Total # Ops", str(perf_details.layer_counts["total"])],
                 ["Compute Unit(s)", " ".join(compute_units)],
             ]
         )